@@ -1,21 +1,31 @@
 from django.contrib import admin
-from .models import Word, Game, Guess, UserProfile
+from .models import DailyGuessStats, DailyStats, Word, WordSchedule, Game, Guess, UserProfile
 
 
 @admin.register(Word)
 class WordAdmin(admin.ModelAdmin):
-    list_display = ['word', 'is_active', 'created_at']
+    list_display = ['word', 'is_active', 'difficulty', 'created_at']
     list_filter = ['is_active', 'created_at']
     search_fields = ['word']
     ordering = ['word']
+    readonly_fields = ['difficulty']
+
+
+@admin.register(WordSchedule)
+class WordScheduleAdmin(admin.ModelAdmin):
+    list_display = ['date', 'slot', 'word']
+    list_filter = ['date']
+    search_fields = ['word__word']
+    ordering = ['date', 'slot']
+    raw_id_fields = ['word']
 
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
-    list_display = ['user', 'is_admin', 'games_played', 'games_won', 'win_rate']
+    list_display = ['user', 'is_admin', 'games_played', 'games_won', 'win_rate', 'best_streak']
     list_filter = ['is_admin', 'created_at']
     search_fields = ['user__username']
-    readonly_fields = ['games_played', 'games_won', 'created_at']
+    readonly_fields = ['games_played', 'games_won', 'total_guesses', 'current_streak', 'best_streak', 'created_at']
 
 
 class GuessInline(admin.TabularInline):
@@ -39,3 +49,20 @@ class GuessAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['game__user__username', 'guess_word']
     readonly_fields = ['feedback', 'created_at']
+
+
+@admin.register(DailyStats)
+class DailyStatsAdmin(admin.ModelAdmin):
+    list_display = ['date', 'games_started', 'players_started', 'games_completed', 'games_won', 'success_rate']
+    ordering = ['-date']
+    readonly_fields = [
+        'date', 'games_started', 'players_started', 'games_completed',
+        'games_won', 'players_completed', 'total_guesses',
+    ]
+
+
+@admin.register(DailyGuessStats)
+class DailyGuessStatsAdmin(admin.ModelAdmin):
+    list_display = ['date', 'guess_number', 'guesses', 'total_candidates']
+    ordering = ['-date', 'guess_number']
+    readonly_fields = ['date', 'guess_number', 'guesses', 'total_candidates']
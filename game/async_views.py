@@ -0,0 +1,162 @@
+"""Async versions of the gameplay views, for running under an ASGI server.
+
+Selected in game/urls.py when the GAME_ASYNC_VIEWS setting is on. Single
+row reads and updates use Django's async ORM (aget/afirst/aupdate).
+Multi-query operations that need a transaction, such as starting a game or
+submitting a guess, reuse the model methods through sync_to_async, because
+Django 4.2 has no async transactions. Template rendering also runs through
+sync_to_async, since rendering base.html reads the session for messages.
+"""
+import random
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.views import redirect_to_login
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
+from django.shortcuts import redirect, render
+from django.utils import timezone
+
+from . import metrics, quota
+from .board import get_board
+from .forms import GuessForm
+from .models import Game, Word
+
+
+def _load_user(request):
+    # Evaluate the lazy request.user in a thread so later access is safe
+    request.user.is_authenticated
+    return request.user
+
+
+def async_login_required(view):
+    """login_required for async views (Django 4.2's decorator is sync only)"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await sync_to_async(_load_user)(request)
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path(), settings.LOGIN_URL)
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+async def aget_user_game(request, game_id):
+    try:
+        return await Game.objects.select_related('word').aget(id=game_id, user=request.user)
+    except Game.DoesNotExist:
+        raise Http404('No Game matches the given query.')
+
+
+arender = sync_to_async(render)
+
+
+@async_login_required
+async def start_game(request):
+    """Start a new game"""
+    # Check if user has an active game
+    active_game = await Game.objects.filter(user=request.user, status='ACTIVE').only('id').afirst()
+    if active_game:
+        return redirect('play_game', game_id=active_game.id)
+
+    # Create new game if the user has a game left today
+    try:
+        game = await sync_to_async(Game.start_for_user)(request.user)
+    except Word.DoesNotExist:
+        messages.error(request, 'No words available. Please contact admin.')
+        return redirect('home')
+    if not game:
+        messages.error(
+            request,
+            f'You have reached the daily limit of {quota.daily_limit()} games. Try again tomorrow!'
+        )
+        return redirect('home')
+
+    messages.success(request, 'New game started! Good luck!')
+    return redirect('play_game', game_id=game.id)
+
+
+@async_login_required
+async def play_game(request, game_id):
+    """Play the game"""
+    game = await aget_user_game(request, game_id)
+
+    # If game is completed, redirect to result
+    if game.is_completed():
+        return redirect('game_result', game_id=game.id)
+
+    if request.method == 'POST':
+        form = GuessForm(request.POST)
+        # Validation may look the guess up in the Word table
+        if await sync_to_async(form.is_valid)():
+            # Check if game can accept more guesses
+            if not game.can_guess():
+                messages.error(request, 'This game is no longer active.')
+                return redirect('game_result', game_id=game.id)
+
+            if not await sync_to_async(game.submit_guess)(form.cleaned_data['guess']):
+                messages.error(request, 'This game is no longer active.')
+                return redirect('game_result', game_id=game.id)
+            if game.is_completed():
+                return redirect('game_result', game_id=game.id)
+
+            messages.info(request, f'Guess {game.guesses_count} submitted!')
+    else:
+        form = GuessForm()
+
+    context = {
+        'game': game,
+        'form': form,
+        'board': await sync_to_async(get_board)(game),
+        'remaining_guesses': game.max_guesses - game.guesses_count,
+    }
+
+    return await arender(request, 'game/play.html', context)
+
+
+@async_login_required
+async def game_result(request, game_id):
+    """Show game result"""
+    game = await aget_user_game(request, game_id)
+    board = await sync_to_async(get_board)(game)
+
+    context = {
+        'game': game,
+        'board': board,
+        'last_guess': board.last_guess,
+    }
+    if settings.GAME_DAILY_WORD and game.is_completed():
+        context['word_stats'] = await sync_to_async(Game.word_stats)(
+            game.word_id, timezone.localdate(game.created_at)
+        )
+
+    return await arender(request, 'game/result.html', context)
+
+
+@async_login_required
+async def get_hint(request, game_id):
+    """Async version of views.get_hint"""
+    # require_http_methods does not support async views in Django 4.2
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    game = await aget_user_game(request, game_id)
+    # If game completed, no hints
+    if game.is_completed():
+        return JsonResponse({"ok": False, "error": "Game is completed."}, status=400)
+
+    if game.hint_used:
+        return JsonResponse({"ok": False, "error": "Hint already used for this game."}, status=429)
+
+    target = game.word.word
+    candidates = [i for i in range(len(target)) if not game.revealed_mask & (1 << i)]
+    if not candidates:
+        return JsonResponse({"ok": False, "error": "All letters already revealed by guesses."}, status=400)
+
+    # Mark hint as used, unless a concurrent request got there first
+    if not await Game.objects.filter(id=game.id, hint_used=False).aupdate(hint_used=True):
+        return JsonResponse({"ok": False, "error": "Hint already used for this game."}, status=429)
+
+    metrics.hints_used.inc()
+    idx = random.choice(candidates)
+    return JsonResponse({"ok": True, "index": idx, "letter": target[idx]})
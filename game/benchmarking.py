@@ -0,0 +1,55 @@
+"""Helpers shared by the benchmark and load-check management commands.
+
+They play games through the real views against a throwaway copy of the
+configured database, so measurements never touch production data.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, connections
+
+BENCH_WORDS = [
+    'APPLE', 'BRAVE', 'CRANE', 'DRIVE', 'EAGLE', 'FLAME', 'GRAPE', 'HOUSE',
+    'LIGHT', 'MONEY', 'NIGHT', 'OCEAN', 'PLANT', 'QUEEN', 'RIVER', 'STONE',
+]
+
+
+@contextmanager
+def throwaway_database():
+    """Create and migrate a test database, seeded with BENCH_WORDS, for the duration of the block.
+
+    SQLite test databases are files rather than in-memory, so every thread
+    gets its own connection as it would in production. Guesses are not
+    checked against the guess dictionary, and metrics and the word list
+    version go to a temporary directory.
+    """
+    from django.test.utils import setup_test_environment
+
+    from .models import Word
+
+    setup_test_environment()
+    settings.GUESS_DICTIONARY_PATH = os.devnull + '.missing'
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep benchmark games out of the real metrics
+        settings.GAME_METRICS_DIR = os.path.join(tmp, 'metrics')
+        settings.WORD_LIST_VERSION_PATH = os.path.join(tmp, 'word_list.version')
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = os.path.join(tmp, 'bench.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            Word.objects.bulk_create([Word(word=word) for word in BENCH_WORDS])
+            yield
+        finally:
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
@@ -0,0 +1,84 @@
+"""Board view-model shared by the play and result pages.
+
+A game's guesses are read with one query and decoded into rows of
+``Cell(letter, state)``, each carrying the candidate count after that guess,
+padded with empty rows up to the game's ``max_guesses``. The decoded
+guesses are cached per game and dropped when a guess for that game is
+saved or deleted.
+
+The cache key includes the game's guess count, so a worker whose game row
+is already ahead never reads a board cached before the latest guess, and
+a board is only cached when the number of rows read matches that count.
+"""
+from collections import namedtuple
+
+from django.core.cache import cache
+
+from .scoring import WORD_LENGTH
+
+Cell = namedtuple('Cell', ['letter', 'state'])
+
+Row = namedtuple('Row', ['cells', 'candidates_remaining'])
+
+EMPTY_CELL = Cell('', '')
+
+CACHE_TIMEOUT = 60 * 60
+CACHE_VERSION = 3
+
+# Boards with more guesses than this are not cached, which bounds the keys
+# invalidate_board has to drop without loading the game
+MAX_CACHED_GUESSES = 10
+
+
+def cache_key(game_id, guesses_count):
+    return f'game:board:{game_id}:{guesses_count}'
+
+
+class Board:
+    """Guesses of one game laid out as a grid of cells"""
+
+    def __init__(self, game, guesses):
+        self.game = game
+        # List of (guess_word, feedback, candidates_remaining) in guess order
+        self.guesses = guesses
+        self.rows = [
+            Row([Cell(letter, state) for letter, state in zip(word, feedback)], remaining)
+            for word, feedback, remaining in guesses
+        ]
+        empty_row = Row([EMPTY_CELL] * WORD_LENGTH, None)
+        self.rows += [empty_row] * max(0, game.max_guesses - len(self.rows))
+
+    def __len__(self):
+        return len(self.guesses)
+
+    @property
+    def last_guess(self):
+        return self.guesses[-1][0] if self.guesses else None
+
+
+def get_board(game, guesses_count=None):
+    """Return the Board for a game, loading its guesses once and caching them
+
+    guesses_count defaults to ``game.guesses_count``; pass it to read the
+    board as it was before a guess that is being recorded.
+    """
+    if guesses_count is None:
+        guesses_count = game.guesses_count
+    key = cache_key(game.id, guesses_count)
+    guesses = cache.get(key, version=CACHE_VERSION)
+    if guesses is None:
+        guesses = list(
+            game.guesses.filter(guess_number__lte=guesses_count)
+            .order_by('guess_number').values_list('guess_word', 'feedback', 'candidates_remaining')
+        )
+        if len(guesses) == guesses_count <= MAX_CACHED_GUESSES:
+            cache.set(key, guesses, CACHE_TIMEOUT, version=CACHE_VERSION)
+    return Board(game, guesses)
+
+
+def invalidate_board(game_id, guess_number):
+    """Drop every cached board that contains the given guess"""
+    cache.delete_many(
+        [cache_key(game_id, count) for count in range(guess_number, MAX_CACHED_GUESSES + 1)],
+        version=CACHE_VERSION,
+    )
@@ -0,0 +1,99 @@
+"""Letter-position bitset index for counting remaining candidate words.
+
+Every active word gets one bit. For each (position, letter) the index keeps
+a Python int with the bits of the words that have that letter there, and
+for each (letter, k) the words containing at least k copies of the letter.
+The constraints implied by a game's feedback so far are then a handful of
+big-int ANDs, and the number of words still consistent with them is a
+``bit_count``.
+
+The index is built once per process and rebuilt when the word list version
+in ``word_pool`` changes.
+"""
+import numpy as np
+
+from . import scoring, word_pool
+
+WORD_LENGTH = scoring.WORD_LENGTH
+ALPHABET_SIZE = scoring.ALPHABET_SIZE
+
+
+def _to_bitset(flags):
+    """Convert a boolean numpy array into an int with bit i set for flags[i]"""
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+
+class CandidateIndex:
+    """Bitsets over a word list for intersecting feedback constraints"""
+
+    def __init__(self, words):
+        self.words = tuple(words)
+        self.all = (1 << len(self.words)) - 1
+        encoded = scoring.encode_words(self.words)
+
+        # at[i][c]: words with letter c at position i
+        self.at = [
+            [_to_bitset(encoded[:, i] == c) for c in range(ALPHABET_SIZE)]
+            for i in range(WORD_LENGTH)
+        ]
+        # at_least[c][k]: words with at least k copies of letter c
+        letter_counts = np.stack(
+            [(encoded == c).sum(axis=1) for c in range(ALPHABET_SIZE)]
+        )
+        self.at_least = [
+            [_to_bitset(letter_counts[c] >= k) for k in range(WORD_LENGTH + 2)]
+            for c in range(ALPHABET_SIZE)
+        ]
+
+    def __len__(self):
+        return len(self.words)
+
+    def matching(self, guesses):
+        """Bitset of words consistent with every (guess_word, feedback) pair"""
+        mask = self.all
+        for word, feedback in guesses:
+            found = {}
+            capped = set()
+            for i, (letter, state) in enumerate(zip(word, feedback)):
+                c = ord(letter) - 65
+                if state == 'correct':
+                    mask &= self.at[i][c]
+                else:
+                    mask &= ~self.at[i][c]
+                if state == 'incorrect':
+                    # The target has no more copies than were marked found
+                    capped.add(c)
+                else:
+                    found[c] = found.get(c, 0) + 1
+
+            for c in set(found) | capped:
+                k = found.get(c, 0)
+                if k:
+                    mask &= self.at_least[c][k]
+                if c in capped:
+                    mask &= ~self.at_least[c][k + 1]
+        return mask
+
+    def count(self, guesses):
+        """Number of words consistent with every (guess_word, feedback) pair"""
+        return self.matching(guesses).bit_count()
+
+    def candidates(self, guesses):
+        mask = self.matching(guesses)
+        return [word for i, word in enumerate(self.words) if mask >> i & 1]
+
+
+_index = None
+_index_version = None
+
+
+def get_index():
+    """Return the candidate index over active words, built once per word list version"""
+    global _index, _index_version
+    version = word_pool.get_version()
+    if _index is None or _index_version != version:
+        from .models import Word
+        words = Word.objects.filter(is_active=True).order_by('word').values_list('word', flat=True)
+        _index = CandidateIndex(words)
+        _index_version = version
+    return _index
@@ -0,0 +1,70 @@
+"""Cached snapshot of the admin dashboard figures.
+
+All figures come from one query: a UNION of single-row counts, with
+today's numbers read from the ``DailyStats`` rollup instead of scanning
+``Game``. The snapshot is shared through the cache. Once it is older than
+``ADMIN_DASHBOARD_CACHE_SECONDS`` the first request to notice rebuilds it,
+while concurrent requests keep being served the previous snapshot.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Count, F, Value
+from django.utils import timezone
+
+CACHE_KEY = 'game:dashboard'
+REFRESH_LOCK_KEY = 'game:dashboard:refresh'
+REFRESH_LOCK_TIMEOUT = 30
+
+FIGURES = ['total_users', 'total_games', 'total_words', 'games_today', 'users_today']
+
+
+def _count(queryset, name):
+    return (
+        queryset.order_by()
+        .annotate(figure=Value(name, output_field=CharField()))
+        .values('figure')
+        .annotate(value=Count('pk'))
+        .values_list('figure', 'value')
+    )
+
+
+def _from_daily_stats(queryset, name, field):
+    return (
+        queryset.order_by()
+        .annotate(figure=Value(name, output_field=CharField()), value=F(field))
+        .values_list('figure', 'value')
+    )
+
+
+def build_snapshot():
+    """Compute the dashboard figures with a single query"""
+    from .models import DailyStats, Game, UserProfile, Word
+    today = DailyStats.objects.filter(date=timezone.localdate())
+    figures = _count(UserProfile.objects.all(), 'total_users').union(
+        _count(Game.objects.filter(status__in=['WON', 'LOST']), 'total_games'),
+        _count(Word.objects.filter(is_active=True), 'total_words'),
+        _from_daily_stats(today, 'games_today', 'games_started'),
+        _from_daily_stats(today, 'users_today', 'players_started'),
+        all=True,
+    )
+    snapshot = dict.fromkeys(FIGURES, 0)
+    snapshot.update(figures)
+    snapshot['generated_at'] = timezone.now()
+    return snapshot
+
+
+def get_snapshot():
+    """Return the cached snapshot, rebuilding it when it has gone stale"""
+    cached = cache.get(CACHE_KEY)
+    max_age = settings.ADMIN_DASHBOARD_CACHE_SECONDS
+    if cached is not None:
+        fresh = (timezone.now() - cached['generated_at']).total_seconds() < max_age
+        # Only one request refreshes a stale snapshot; the rest serve it as is
+        if fresh or not cache.add(REFRESH_LOCK_KEY, True, REFRESH_LOCK_TIMEOUT):
+            return cached
+
+    snapshot = build_snapshot()
+    # Kept past max_age so a stale copy can be served while it is rebuilt
+    cache.set(CACHE_KEY, snapshot, max_age * 10)
+    cache.delete(REFRESH_LOCK_KEY)
+    return snapshot
@@ -0,0 +1,127 @@
+"""Dictionary of allowed guesses, stored as a memory-mapped bitset.
+
+Every possible 5-letter uppercase word maps to one bit in a 26 ** 5 bit
+(about 1.5 MB) bitset, so a membership check is a single byte lookup. The
+file is opened with ``mmap`` on first use, so loading adds nothing to worker
+startup and all worker processes share the same pages through the OS page
+cache.
+
+File layout: an 8-byte magic header, a little-endian uint32 word count, then
+the bitset itself. Build it with ``python manage.py build_dictionary``.
+"""
+import mmap
+import os
+import struct
+import threading
+
+from django.conf import settings
+
+WORD_LENGTH = 5
+MAGIC = b'GTWDICT1'
+HEADER = struct.Struct('<8sI')
+NUM_BITS = 26 ** WORD_LENGTH
+NUM_BYTES = (NUM_BITS + 7) // 8
+
+
+def word_index(word):
+    """Map a 5-letter uppercase word to its bit position"""
+    index = 0
+    for letter in word:
+        index = index * 26 + (ord(letter) - 65)
+    return index
+
+
+def normalize(word):
+    """Return the uppercase form of word if it is a valid 5-letter word, else None"""
+    word = word.strip().upper()
+    if len(word) == WORD_LENGTH and word.isascii() and word.isalpha():
+        return word
+    return None
+
+
+def write_index(path, words):
+    """Write the bitset index for words to path and return the word count.
+
+    The file is written next to the target and moved into place, so workers
+    that still have the old file mapped keep reading a consistent copy.
+    """
+    bits = bytearray(NUM_BYTES)
+    count = 0
+    for word in words:
+        index = word_index(word)
+        mask = 1 << (index & 7)
+        if not bits[index >> 3] & mask:
+            bits[index >> 3] |= mask
+            count += 1
+
+    os.makedirs(os.path.dirname(os.fspath(path)) or '.', exist_ok=True)
+    tmp_path = f'{os.fspath(path)}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, count))
+        f.write(bits)
+    os.replace(tmp_path, path)
+    return count
+
+
+class Dictionary:
+    """Read-only view over a memory-mapped bitset index file"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.word_count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or len(self._map) != HEADER.size + NUM_BYTES:
+            self._map.close()
+            raise ValueError(f'{path} is not a guess dictionary index')
+
+    def __len__(self):
+        return self.word_count
+
+    def __contains__(self, word):
+        index = word_index(word)
+        return bool(self._map[HEADER.size + (index >> 3)] & (1 << (index & 7)))
+
+    def close(self):
+        self._map.close()
+
+
+_dictionary = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def get_dictionary():
+    """Return the shared Dictionary, or None if no index file has been built"""
+    global _dictionary, _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                path = settings.GUESS_DICTIONARY_PATH
+                _dictionary = Dictionary(path) if os.path.exists(path) else None
+                _loaded = True
+    return _dictionary
+
+
+def reset():
+    """Forget the loaded index so the next lookup maps the file again"""
+    global _dictionary, _loaded
+    with _lock:
+        if _dictionary is not None:
+            _dictionary.close()
+        _dictionary = None
+        _loaded = False
+
+
+def is_allowed_guess(word):
+    """Check a normalized guess against the dictionary.
+
+    Every word is allowed when no index has been built, which keeps fresh
+    checkouts playable before ``build_dictionary`` has been run. Words
+    missing from the index are looked up in the ``Word`` table, so target
+    words added after the index was built can still be guessed.
+    """
+    dictionary = get_dictionary()
+    if dictionary is None or word in dictionary:
+        return True
+    from .models import Word
+    return Word.objects.filter(word=word).exists()
@@ -0,0 +1,77 @@
+"""Word difficulty analysis.
+
+For an answer word ``t`` and an opening guess ``g``, the candidates left
+after seeing the feedback are the answers ``t'`` whose pattern
+``score(g, t')`` equals ``score(g, t)``. The difficulty of ``t`` is the
+average number of candidates left, over every opening guess in the list.
+The best opening guess, the one an optimal guesser would play first,
+minimises the same count averaged over all answers.
+
+The work is O(words ** 2). ``analyze`` splits the guesses into blocks and
+scores each block against all answers in a process pool, using the same
+rules as ``Guess.generate_feedback`` (see ``scoring``).
+"""
+import multiprocessing
+import os
+
+import numpy as np
+
+from . import scoring
+
+_words = None
+
+
+def _init_worker(encoded):
+    global _words
+    _words = encoded
+
+
+def _analyze_block(bounds):
+    """Score guesses [start, stop) against every answer.
+
+    Returns (start, per-answer sum of remaining candidates, per-guess mean of
+    remaining candidates).
+    """
+    start, stop = bounds
+    patterns = scoring.score_matrix(_words[start:stop], _words).astype(np.intp)
+    rows = len(patterns)
+
+    # Bucket sizes for every (guess, pattern), then look up each answer's bucket
+    offsets = np.arange(rows, dtype=np.intp)[:, None] * scoring.NUM_PATTERNS
+    counts = np.bincount((patterns + offsets).ravel(), minlength=rows * scoring.NUM_PATTERNS)
+    remaining = counts.reshape(rows, scoring.NUM_PATTERNS)[np.arange(rows)[:, None], patterns]
+
+    return start, remaining.sum(axis=0), remaining.mean(axis=1)
+
+
+def analyze(words, workers=None, block_size=256):
+    """Compute difficulty for every word in words.
+
+    Returns (difficulties, guess_scores): numpy arrays aligned with words,
+    holding each answer's average remaining candidates and each opening
+    guess's average remaining candidates.
+    """
+    encoded = scoring.encode_words(list(words))
+    n = len(encoded)
+    totals = np.zeros(n, dtype=np.float64)
+    guess_scores = np.zeros(n, dtype=np.float64)
+    if not n:
+        return totals, guess_scores
+
+    blocks = [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(encoded)
+        results = map(_analyze_block, blocks)
+        return _collect(results, totals, guess_scores, n)
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(encoded,)) as pool:
+        results = pool.imap_unordered(_analyze_block, blocks)
+        return _collect(results, totals, guess_scores, n)
+
+
+def _collect(results, totals, guess_scores, n):
+    for start, answer_sums, block_scores in results:
+        totals += answer_sums
+        guess_scores[start:start + len(block_scores)] = block_scores
+    return totals / n, guess_scores
@@ -0,0 +1,144 @@
+"""Streaming CSV and NDJSON exports for admin reports.
+
+Rows are produced by generators over chunked ``QuerySet.iterator()`` calls
+and written straight into a ``StreamingHttpResponse``, so memory use stays
+flat however many rows are exported.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+from .models import DailyPlayCount, DailyStats, Game
+
+CHUNK_SIZE = 2000
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    """File-like object whose write() returns the value, for csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def daily_rows(start=None, end=None):
+    stats = DailyStats.objects.order_by('date')
+    if start:
+        stats = stats.filter(date__gte=start)
+    if end:
+        stats = stats.filter(date__lte=end)
+    for day in stats.iterator(chunk_size=CHUNK_SIZE):
+        yield {
+            'date': day.date,
+            'users_count': day.players_completed,
+            'total_games': day.games_completed,
+            'correct_guesses': day.games_won,
+            'success_rate': day.success_rate(),
+        }
+
+
+def user_rows(user, start=None, end=None):
+    days = DailyPlayCount.objects.filter(user=user, games_completed__gt=0).order_by('date')
+    if start:
+        days = days.filter(date__gte=start)
+    if end:
+        days = days.filter(date__lte=end)
+    for day in days.iterator(chunk_size=CHUNK_SIZE):
+        yield {
+            'username': user.username,
+            'date': day.date,
+            'words_tried': day.games_completed,
+            'correct_guesses': day.games_won,
+        }
+
+
+def game_rows(start=None, end=None):
+    """Every game with its guesses nested under 'guesses'"""
+    games = Game.objects.select_related('user', 'word').prefetch_related('guesses').order_by('id')
+    if start:
+        games = games.filter(created_at__date__gte=start)
+    if end:
+        games = games.filter(created_at__date__lte=end)
+    for game in games.iterator(chunk_size=CHUNK_SIZE):
+        yield {
+            'game_id': game.id,
+            'username': game.user.username,
+            'word': game.word.word,
+            'status': game.status,
+            'guesses_count': game.guesses_count,
+            'created_at': game.created_at,
+            'completed_at': game.completed_at,
+            'guesses': [
+                {
+                    'guess_number': guess.guess_number,
+                    'guess_word': guess.guess_word,
+                    'feedback': guess.feedback,
+                    'created_at': guess.created_at,
+                }
+                for guess in game.guesses.all()
+            ],
+        }
+
+
+def flatten_games(rows):
+    """One CSV row per guess, repeating the game columns"""
+    for row in rows:
+        guesses = row.pop('guesses')
+        if not guesses:
+            yield row
+        for guess in guesses:
+            yield {
+                **row,
+                'guess_number': guess['guess_number'],
+                'guess_word': guess['guess_word'],
+                'feedback': ','.join(guess['feedback']),
+                'guessed_at': guess['created_at'],
+            }
+
+
+GAME_CSV_FIELDS = [
+    'game_id', 'username', 'word', 'status', 'guesses_count', 'created_at',
+    'completed_at', 'guess_number', 'guess_word', 'feedback', 'guessed_at',
+]
+
+
+def stream_csv(rows, fieldnames):
+    writer = csv.DictWriter(Echo(), fieldnames=fieldnames, restval='')
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def export_response(report, fmt, start=None, end=None, user=None):
+    """Build a StreamingHttpResponse for report ('daily', 'user' or 'games')"""
+    if report == 'daily':
+        rows = daily_rows(start, end)
+        fieldnames = ['date', 'users_count', 'total_games', 'correct_guesses', 'success_rate']
+    elif report == 'user':
+        rows = user_rows(user, start, end)
+        fieldnames = ['username', 'date', 'words_tried', 'correct_guesses']
+    else:
+        rows = game_rows(start, end)
+        fieldnames = GAME_CSV_FIELDS
+
+    if fmt == 'csv':
+        if report == 'games':
+            rows = flatten_games(rows)
+        content = stream_csv(rows, fieldnames)
+    else:
+        content = stream_ndjson(rows)
+
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{report}_report.{fmt}"'
+    return response
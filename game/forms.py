@@ -3,6 +3,9 @@ from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 import re
+from urllib.parse import urlencode
+
+from . import dictionary
 
 
 class CustomUserCreationForm(UserCreationForm):
@@ -89,8 +92,12 @@ class GuessForm(forms.Form):
             raise ValidationError("Guess must be exactly 5 letters long.")
         
         # Check if all characters are letters
-        if not guess.isalpha():
+        if not (guess.isascii() and guess.isalpha()):
             raise ValidationError("Guess must contain only letters.")
+
+        # Check the word against the dictionary of allowed guesses
+        if not dictionary.is_allowed_guess(guess):
+            raise ValidationError(f'"{guess}" is not in the word list.')
         
         return guess
 
@@ -136,3 +143,101 @@ class AdminReportForm(forms.Form):
             raise ValidationError("User is required for user report.")
 
         return cleaned_data
+
+
+class ExportForm(forms.Form):
+    """Form for streaming report exports"""
+    REPORT_CHOICES = [
+        ('daily', 'Daily Report'),
+        ('user', 'User Report'),
+        ('games', 'All Games and Guesses'),
+    ]
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('ndjson', 'NDJSON'),
+    ]
+
+    report = forms.ChoiceField(
+        choices=REPORT_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+
+    format = forms.ChoiceField(
+        choices=FORMAT_CHOICES,
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+
+    start = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={
+            'class': 'form-control',
+            'type': 'date'
+        }),
+    )
+
+    end = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={
+            'class': 'form-control',
+            'type': 'date'
+        }),
+    )
+
+    user = forms.ModelChoiceField(
+        queryset=User.objects.all(),
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-control'}),
+        help_text="Select user for user report"
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+
+        if cleaned_data.get('report') == 'user' and not cleaned_data.get('user'):
+            raise ValidationError("User is required for user report.")
+
+        return cleaned_data
+
+
+class WordSearchForm(forms.Form):
+    """Search and filter form for the manage words page"""
+    STATUS_CHOICES = [
+        ('', 'All words'),
+        ('active', 'Active'),
+        ('inactive', 'Inactive'),
+    ]
+
+    q = forms.CharField(
+        required=False,
+        max_length=5,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Starts with...',
+            'style': 'text-transform:uppercase;'
+        })
+    )
+
+    status = forms.ChoiceField(
+        choices=STATUS_CHOICES,
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-control'})
+    )
+
+    def clean_q(self):
+        return self.cleaned_data.get('q', '').upper().strip()
+
+    def filter(self, words):
+        prefix = self.cleaned_data['q']
+        if prefix:
+            # A range on the unique word index instead of LIKE 'prefix%'
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            words = words.filter(word__gte=prefix, word__lt=upper)
+        if self.cleaned_data['status']:
+            words = words.filter(is_active=self.cleaned_data['status'] == 'active')
+        return words
+
+    def query_string(self):
+        """Current search as a query string, for pagination links"""
+        if not self.is_valid():
+            return ''
+        return urlencode({key: value for key, value in self.cleaned_data.items() if value})
@@ -0,0 +1,98 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+
+from game.models import DailyGuessStats, DailyPlayCount, DailyStats, Game, Guess
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the DailyStats, DailyGuessStats and DailyPlayCount rollups from the Game and Guess tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='First date to rebuild (YYYY-MM-DD)')
+        parser.add_argument('--end', help='Last date to rebuild (YYYY-MM-DD)')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rollup rows written per query',
+        )
+
+    def handle(self, *args, **options):
+        games = Game.objects.annotate(date=TruncDate('created_at'))
+        if options['start']:
+            games = games.filter(date__gte=options['start'])
+        if options['end']:
+            games = games.filter(date__lte=options['end'])
+        completed = Q(status__in=['WON', 'LOST'])
+
+        per_user = games.order_by().values('user_id', 'date').annotate(**DailyPlayCount.game_counts())
+        user_rows = self.write(
+            DailyPlayCount,
+            (DailyPlayCount(**row) for row in per_user.iterator()),
+            unique_fields=['user', 'date'],
+            update_fields=['games_started', 'games_completed', 'games_won'],
+            batch_size=options['batch_size'],
+        )
+
+        per_day = games.order_by().values('date').annotate(
+            games_started=Count('id'),
+            players_started=Count('user', distinct=True),
+            games_completed=Count('id', filter=completed),
+            games_won=Count('id', filter=Q(status='WON')),
+            players_completed=Count('user', filter=completed, distinct=True),
+            total_guesses=Sum('guesses_count', filter=completed, default=0),
+        )
+        day_rows = self.write(
+            DailyStats,
+            (DailyStats(**row) for row in per_day.iterator()),
+            unique_fields=['date'],
+            update_fields=[
+                'games_started', 'players_started', 'games_completed',
+                'games_won', 'players_completed', 'total_guesses',
+            ],
+            batch_size=options['batch_size'],
+        )
+
+        guesses = Guess.objects.filter(candidates_remaining__isnull=False).annotate(date=TruncDate('game__created_at'))
+        if options['start']:
+            guesses = guesses.filter(date__gte=options['start'])
+        if options['end']:
+            guesses = guesses.filter(date__lte=options['end'])
+        per_guess = guesses.order_by().values('date', 'guess_number').annotate(
+            guesses=Count('id'),
+            total_candidates=Sum('candidates_remaining'),
+        )
+        guess_rows = self.write(
+            DailyGuessStats,
+            (DailyGuessStats(**row) for row in per_guess.iterator()),
+            unique_fields=['date', 'guess_number'],
+            update_fields=['guesses', 'total_candidates'],
+            batch_size=options['batch_size'],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\nSummary: {day_rows} days, {guess_rows} day-guess rows and {user_rows} user-days rebuilt'
+            )
+        )
+
+    def write(self, model, rows, batch_size, **conflict_options):
+        """Upsert rows in batches, each batch in its own transaction"""
+        written = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                written += self.flush(model, batch, **conflict_options)
+                batch = []
+        if batch:
+            written += self.flush(model, batch, **conflict_options)
+        return written
+
+    def flush(self, model, batch, **conflict_options):
+        with transaction.atomic():
+            model.objects.bulk_create(batch, update_conflicts=True, **conflict_options)
+        self.stdout.write(f'{model._meta.verbose_name_plural}: wrote {len(batch)} rows')
+        return len(batch)
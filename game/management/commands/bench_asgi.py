@@ -0,0 +1,170 @@
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import ThreadSensitiveContext
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from game.benchmarking import BENCH_WORDS, throwaway_database
+from game.models import Game
+
+
+class Command(BaseCommand):
+    help = 'Compare gameplay throughput of the sync views (WSGI) and the async views (ASGI)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players',
+            type=int,
+            default=50,
+            help='Number of players playing one game each, concurrently',
+        )
+        parser.add_argument(
+            '--db-latency-ms',
+            type=float,
+            default=0,
+            help='Delay added to every query, to simulate a database over the network',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=8,
+            help='Worker threads for the WSGI run',
+        )
+        parser.add_argument(
+            '--mode',
+            choices=['wsgi', 'asgi'],
+            help='Run only this mode in the current process and print JSON results',
+        )
+
+    def handle(self, *args, **options):
+        if options['mode']:
+            self.stdout.write(json.dumps(self.run_mode(options)))
+            return
+
+        # Each mode runs in its own process, since GAME_ASYNC_VIEWS is read
+        # when the URLconf is imported
+        results = {}
+        for mode in ('wsgi', 'asgi'):
+            env = dict(os.environ, GAME_ASYNC_VIEWS='1' if mode == 'asgi' else '0')
+            cmd = [
+                sys.executable, sys.argv[0], 'bench_asgi', '--mode', mode,
+                '--players', str(options['players']),
+                '--db-latency-ms', str(options['db_latency_ms']),
+                '--threads', str(options['threads']),
+            ]
+            proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+            if proc.returncode:
+                raise CommandError(f'{mode} run failed:\n{proc.stderr}')
+            results[mode] = json.loads(proc.stdout.strip().splitlines()[-1])
+            self.stdout.write(
+                f'{mode.upper()}: {results[mode]["requests"]} requests in '
+                f'{results[mode]["seconds"]:.2f}s ({results[mode]["rps"]:,.1f} req/s)'
+            )
+
+        speedup = results['asgi']['rps'] / results['wsgi']['rps']
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\nSummary: ASGI served {speedup:.2f}x the requests per second of WSGI '
+                f'with {options["players"]} players'
+            )
+        )
+
+    def run_mode(self, options):
+        mode = options['mode']
+        if settings.GAME_ASYNC_VIEWS != (mode == 'asgi'):
+            raise CommandError('Run modes through the parent command so GAME_ASYNC_VIEWS is set.')
+
+        with throwaway_database():
+            users = self.seed(options['players'])
+            latency = options['db_latency_ms'] / 1000
+            if latency:
+                connection_created.connect(self.make_slow(latency), weak=False)
+
+            started = time.perf_counter()
+            if mode == 'asgi':
+                requests = asyncio.run(self.run_asgi(users))
+            else:
+                requests = self.run_wsgi(users, options['threads'])
+            seconds = time.perf_counter() - started
+
+            finished = Game.objects.exclude(status='ACTIVE').count()
+
+        return {
+            'mode': mode,
+            'requests': requests,
+            'seconds': seconds,
+            'rps': requests / seconds,
+            'games_finished': finished,
+        }
+
+    def seed(self, players):
+        User.objects.bulk_create([User(username=f'bench{i}') for i in range(players)])
+        return list(User.objects.filter(username__startswith='bench'))
+
+    def make_slow(self, latency):
+        def slow_query(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_wrapper(sender, connection, **kwargs):
+            connection.execute_wrappers.append(slow_query)
+        return add_wrapper
+
+    def guesses(self):
+        return random.sample(BENCH_WORDS, Game._meta.get_field('max_guesses').default)
+
+    def run_wsgi(self, users, threads):
+        def play(user):
+            client = Client()
+            client.force_login(user)
+            game_url = client.post(reverse('start_game')).url
+            game_id = int(game_url.rstrip('/').split('/')[-1])
+            count = 1
+            for guess in self.guesses():
+                response = client.post(game_url, {'guess': guess})
+                count += 1
+                if response.status_code == 302 and 'result' in response.url:
+                    break
+            client.get(reverse('game_result', args=[game_id]))
+            return count + 1
+
+        with ThreadPoolExecutor(threads) as pool:
+            return sum(pool.map(play, users))
+
+    async def run_asgi(self, users):
+        clients = []
+        for user in users:
+            client = AsyncClient()
+            # force_login touches the database, so do it before the event loop is busy
+            await asyncio.to_thread(client.force_login, user)
+            clients.append(client)
+
+        async def request(method, *args, **kwargs):
+            # A real ASGI server gives each request its own sync thread
+            async with ThreadSensitiveContext():
+                return await method(*args, **kwargs)
+
+        async def play(client):
+            game_url = (await request(client.post, reverse('start_game'))).url
+            game_id = int(game_url.rstrip('/').split('/')[-1])
+            count = 1
+            for guess in self.guesses():
+                response = await request(client.post, game_url, {'guess': guess})
+                count += 1
+                if response.status_code == 302 and 'result' in response.url:
+                    break
+            await request(client.get, reverse('game_result', args=[game_id]))
+            return count + 1
+
+        return sum(await asyncio.gather(*(play(client) for client in clients)))
@@ -0,0 +1,143 @@
+import json
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from game.benchmarking import BENCH_WORDS, percentile, throwaway_database
+
+PASSWORD = 'Zebra*Quartz42'
+
+VIEWS = ['register', 'login', 'start_game', 'play_game', 'game_result', 'game_history']
+
+
+class Command(BaseCommand):
+    help = 'Load-test the gameplay flow and report latency percentiles and queries per view'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players',
+            type=int,
+            default=20,
+            help='Number of simulated players, each registering and playing one game',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Number of players playing at the same time',
+        )
+        parser.add_argument(
+            '--save',
+            help='Write the results as JSON to this file, to compare later runs against',
+        )
+        parser.add_argument(
+            '--compare',
+            help='Fail if any view is slower or runs more queries than in this saved JSON baseline',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed median slowdown against the baseline, as a fraction (default 0.25)',
+        )
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            started = time.perf_counter()
+            with ThreadPoolExecutor(options['concurrency']) as pool:
+                samples = list(pool.map(self.play, range(options['players'])))
+            elapsed = time.perf_counter() - started
+
+        # Merge each player's (latencies, query counts) per view
+        timings = defaultdict(list)
+        queries = defaultdict(list)
+        for player in samples:
+            for view, latency, count in player:
+                timings[view].append(latency)
+                queries[view].append(count)
+
+        results = {}
+        self.stdout.write(f'{"view":<14}{"requests":>9}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"queries":>9}')
+        for view in VIEWS:
+            results[view] = {
+                'requests': len(timings[view]),
+                'p50': percentile(timings[view], 50),
+                'p95': percentile(timings[view], 95),
+                'p99': percentile(timings[view], 99),
+                'queries': sum(queries[view]) / len(queries[view]) if queries[view] else 0,
+            }
+            row = results[view]
+            self.stdout.write(
+                f'{view:<14}{row["requests"]:>9}{row["p50"]:>9.1f}{row["p95"]:>9.1f}{row["p99"]:>9.1f}'
+                f'{row["queries"]:>9.1f}'
+            )
+
+        requests = sum(row['requests'] for row in results.values())
+        if options['save']:
+            with open(options['save'], 'w') as f:
+                json.dump(results, f, indent=2)
+        if options['compare']:
+            self.compare(results, options['compare'], options['tolerance'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\nSummary: {requests} requests from {options["players"]} players in {elapsed:.2f}s '
+                f'({requests / elapsed:,.1f} req/s at concurrency {options["concurrency"]})'
+            )
+        )
+
+    def play(self, player):
+        """Register, log in and play one game; return (view, latency ms, queries) per request"""
+        client = Client()
+        samples = []
+
+        def send(view, method, url, data=None):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = method(url, data)
+                latency = (time.perf_counter() - started) * 1000
+            samples.append((view, latency, len(captured)))
+            return response
+
+        username = f'BenchPlayer{player}'
+        response = send('register', client.post, reverse('register'), {
+            'username': username, 'password1': PASSWORD, 'password2': PASSWORD,
+        })
+        if response.status_code != 302:
+            raise CommandError(f'Registering {username} failed: {response.context["form"].errors.as_text()}')
+        send('login', client.post, reverse('login'), {'username': username, 'password': PASSWORD})
+
+        game_url = send('start_game', client.post, reverse('start_game')).url
+        game_id = int(game_url.rstrip('/').split('/')[-1])
+        for guess in random.sample(BENCH_WORDS, 5):
+            if send('play_game', client.post, game_url, {'guess': guess}).status_code == 302:
+                break
+        send('game_result', client.get, reverse('game_result', args=[game_id]))
+        send('game_history', client.get, reverse('game_history'))
+        return samples
+
+    def compare(self, results, path, tolerance):
+        with open(path) as f:
+            baseline = json.load(f)
+
+        regressions = []
+        for view, row in results.items():
+            before = baseline.get(view)
+            if not before:
+                continue
+            # The median is compared, as tail percentiles of short runs are too noisy
+            if row['p50'] > before['p50'] * (1 + tolerance):
+                regressions.append(f'{view}: p50 {before["p50"]:.1f} ms -> {row["p50"]:.1f} ms')
+            if row['queries'] > before['queries'] + 0.5:
+                regressions.append(f'{view}: {before["queries"]:.1f} -> {row["queries"]:.1f} queries per request')
+
+        if regressions:
+            raise CommandError('Regressions against ' + path + ':\n' + '\n'.join(regressions))
+        self.stdout.write(f'No regressions against {path}')
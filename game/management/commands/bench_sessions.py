@@ -0,0 +1,75 @@
+import random
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from game.benchmarking import BENCH_WORDS, throwaway_database
+
+BACKENDS = ['db', 'cached_db', 'signed_cookies']
+
+
+class Command(BaseCommand):
+    help = 'Measure session storage I/O per game under each session backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--games',
+            type=int,
+            default=30,
+            help='Number of games to play per backend',
+        )
+
+    def handle(self, *args, **options):
+        with throwaway_database():
+            for backend in BACKENDS:
+                engine = f'django.contrib.sessions.backends.{backend}'
+                with override_settings(SESSION_ENGINE=engine, GAMES_PER_DAY=options['games']):
+                    self.report(backend, self.play(backend, options['games']))
+
+        self.stdout.write(self.style.SUCCESS(f'\nSummary: {len(BACKENDS)} session backends compared'))
+
+    def play(self, backend, games):
+        """Log in and play games through the views, counting session work"""
+        cache.clear()
+        user = User.objects.create_user(f'bench_{backend}', password='bench')
+        client = Client()
+        stats = {'games': games, 'requests': 0, 'session_queries': 0, 'queries': 0, 'seconds': 0.0}
+
+        def send(method, url, data=None):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = method(url, data)
+                stats['seconds'] += time.perf_counter() - started
+            stats['requests'] += 1
+            stats['queries'] += len(queries)
+            stats['session_queries'] += sum('django_session' in q['sql'] for q in queries.captured_queries)
+            return response
+
+        send(client.post, reverse('login'), {'username': user.username, 'password': 'bench'})
+        for _ in range(games):
+            game_url = send(client.post, reverse('start_game')).url
+            send(client.get, game_url)
+            for guess in random.sample(BENCH_WORDS, len(BENCH_WORDS)):
+                if send(client.post, game_url, {'guess': guess}).status_code == 302:
+                    break
+            send(client.get, reverse('home'))
+
+        cookie = client.cookies.get(settings.SESSION_COOKIE_NAME)
+        stats['cookie_bytes'] = len(cookie.value) if cookie else 0
+        return stats
+
+    def report(self, backend, stats):
+        games = stats['games']
+        self.stdout.write(
+            f'{backend:>15}: {stats["session_queries"] / games:5.2f} session queries/game, '
+            f'{stats["queries"] / games:6.2f} queries/game, '
+            f'{stats["seconds"] * 1000 / stats["requests"]:6.2f} ms/request, '
+            f'session cookie {stats["cookie_bytes"]} bytes'
+        )
@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from game import dictionary
+from game.models import Word
+
+
+class Command(BaseCommand):
+    help = 'Build the memory-mapped dictionary index of allowed guesses'
+
+    def add_arguments(self, parser):
+        parser.add_argument('wordlists', nargs='*', help='Word list files with one word per line')
+        parser.add_argument(
+            '--output',
+            default=str(settings.GUESS_DICTIONARY_PATH),
+            help='Path of the index file to write',
+        )
+        parser.add_argument(
+            '--skip-db-words',
+            action='store_true',
+            help='Do not include the words stored in the Word table',
+        )
+
+    def handle(self, *args, **options):
+        if not options['wordlists'] and options['skip_db_words']:
+            raise CommandError('Nothing to index: give word lists or include the Word table.')
+
+        count = dictionary.write_index(options['output'], self.iter_words(options))
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Wrote {count} words to {options["output"]}')
+        )
+        self.stdout.write('Reload the application workers to pick up the new index.')
+
+    def iter_words(self, options):
+        # Game words are always guessable unless explicitly skipped
+        if not options['skip_db_words']:
+            for word in Word.objects.values_list('word', flat=True).iterator():
+                normalized = dictionary.normalize(word)
+                if normalized:
+                    yield normalized
+
+        skipped = 0
+        for path in options['wordlists']:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    for line in f:
+                        normalized = dictionary.normalize(line)
+                        if normalized:
+                            yield normalized
+                        elif line.strip():
+                            skipped += 1
+            except OSError as exc:
+                raise CommandError(f'Cannot read {path}: {exc}')
+
+        if skipped:
+            self.stdout.write(self.style.WARNING(f'Skipped {skipped} lines that are not 5-letter words'))
@@ -0,0 +1,102 @@
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections
+from django.test import Client
+from django.urls import reverse
+
+from game.benchmarking import BENCH_WORDS, throwaway_database
+from game.models import Game
+
+
+class Command(BaseCommand):
+    help = 'Play many games at once against a throwaway copy of the configured database and report lock errors'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players',
+            type=int,
+            default=100,
+            help='Number of players, each playing a full day of games',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=32,
+            help='Number of players playing at the same time',
+        )
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        self.stdout.write(f'Database: {vendor}, CONN_MAX_AGE={connection.settings_dict["CONN_MAX_AGE"]}')
+
+        with throwaway_database():
+            if vendor == 'sqlite':
+                with connection.cursor() as cursor:
+                    cursor.execute('PRAGMA journal_mode')
+                    self.stdout.write(f'Journal mode: {cursor.fetchone()[0]}')
+
+            User.objects.bulk_create([User(username=f'player{i}') for i in range(options['players'])])
+            users = list(User.objects.filter(username__startswith='player'))
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(options['concurrency']) as pool:
+                results = list(pool.map(self.play_day, users))
+            elapsed = time.perf_counter() - started
+
+            finished = Game.objects.exclude(status='ACTIVE').count()
+
+        requests = sum(count for count, _ in results)
+        errors = Counter()
+        for _, player_errors in results:
+            errors.update(player_errors)
+        for error, count in errors.most_common():
+            self.stdout.write(self.style.ERROR(f'{count} x {error}'))
+
+        locked = sum(count for error, count in errors.items() if 'locked' in error)
+        summary = (
+            f'\nSummary: {requests} requests from {len(users)} players in {elapsed:.2f}s '
+            f'({requests / elapsed:,.1f} req/s), {finished} games finished, '
+            f'{sum(errors.values())} errors ({locked} "database is locked")'
+        )
+        if errors:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
+
+    def play_day(self, user):
+        """Play the user's daily games through the views; return (requests, errors)"""
+        client = Client()
+        requests = 0
+        errors = Counter()
+
+        def send(method, url, data=None):
+            nonlocal requests
+            requests += 1
+            try:
+                return method(url, data)
+            except OperationalError as e:
+                errors[str(e)] += 1
+
+        try:
+            client.force_login(user)
+            for _ in range(settings.GAMES_PER_DAY):
+                response = send(client.post, reverse('start_game'))
+                if response is None or 'play' not in response.url:
+                    continue
+                game_url = response.url
+                for guess in random.sample(BENCH_WORDS, len(BENCH_WORDS)):
+                    response = send(client.post, game_url, {'guess': guess})
+                    if response is not None and response.status_code == 302:
+                        break
+                send(client.get, reverse('home'))
+        except Exception as e:
+            # For instance the login's session save failing on a locked database
+            errors[f'{type(e).__name__}: {e}'] += 1
+        finally:
+            connections.close_all()
+        return requests, errors
@@ -0,0 +1,63 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from game import difficulty
+from game.models import Word
+
+
+class Command(BaseCommand):
+    help = 'Rate every active word by how many candidates remain after an opening guess'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes',
+        )
+        parser.add_argument(
+            '--block-size',
+            type=int,
+            default=256,
+            help='Number of guesses scored per task',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only run the analysis and benchmark, do not save ratings',
+        )
+
+    def handle(self, *args, **options):
+        words = list(Word.objects.filter(is_active=True).order_by('word'))
+        if not words:
+            self.stdout.write(self.style.WARNING('No active words to analyze.'))
+            return
+
+        started = time.perf_counter()
+        ratings, guess_scores = difficulty.analyze(
+            [w.word for w in words],
+            workers=options['workers'],
+            block_size=options['block_size'],
+        )
+        elapsed = time.perf_counter() - started
+        pairs = len(words) ** 2
+
+        if not options['dry_run']:
+            for word, rating in zip(words, ratings):
+                word.difficulty = round(float(rating), 3)
+            with transaction.atomic():
+                Word.objects.bulk_update(words, ['difficulty'], batch_size=1000)
+
+        best = guess_scores.argmin()
+        hardest = ratings.argmax()
+        self.stdout.write(f'Best opening guess: {words[best].word} ({guess_scores[best]:.2f} candidates left on average)')
+        self.stdout.write(f'Hardest word: {words[hardest].word} ({ratings[hardest]:.2f})')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\nSummary: {len(words)} words, {pairs:,} pairs scored in {elapsed:.2f}s '
+                f'({pairs / elapsed:,.0f} pairs/s with {options["workers"]} workers)'
+            )
+        )
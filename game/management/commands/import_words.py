@@ -0,0 +1,109 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from game import dictionary, word_pool
+from game.models import Word
+
+
+class Command(BaseCommand):
+    help = 'Import 5-letter words from a word list file (one word per line)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Word list file, or '-' to read from stdin")
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of words inserted per query',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would change without writing to the database',
+        )
+        parser.add_argument(
+            '--deactivate-missing',
+            action='store_true',
+            help='Deactivate active words that are not in the file',
+        )
+        parser.add_argument(
+            '--progress',
+            type=int,
+            default=10000,
+            help='Report progress every N lines (0 to disable)',
+        )
+
+    def handle(self, *args, **options):
+        self.started = time.monotonic()
+        self.dry_run = options['dry_run']
+        batch_size = options['batch_size']
+
+        # word -> is_active for everything already in the table
+        existing = dict(Word.objects.values_list('word', 'is_active').iterator())
+
+        seen = set()
+        batch = []
+        lines = invalid = created = 0
+        for lines, line in enumerate(self.read_lines(options['path']), start=1):
+            word = dictionary.normalize(line)
+            if word is None:
+                invalid += line.strip() != ''
+            elif word not in seen:
+                seen.add(word)
+                if word not in existing:
+                    batch.append(Word(word=word))
+            if len(batch) >= batch_size:
+                created += self.insert(batch)
+                batch = []
+            if options['progress'] and lines % options['progress'] == 0:
+                self.report(f'Read {lines} lines, {created + len(batch)} new words', lines)
+        created += self.insert(batch)
+
+        deactivated = 0
+        if options['deactivate_missing']:
+            missing = [word for word, active in existing.items() if active and word not in seen]
+            for start in range(0, len(missing), batch_size):
+                deactivated += self.deactivate(missing[start:start + batch_size])
+
+        if (created or deactivated) and not self.dry_run:
+            word_pool.invalidate()
+
+        prefix = '[dry run] ' if self.dry_run else ''
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\n{prefix}Summary: {lines} lines read, {len(seen)} unique words, '
+                f'{created} words created, {len(seen) - created} already existed, '
+                f'{deactivated} deactivated, {invalid} invalid lines skipped'
+            )
+        )
+        self.report('Finished', lines)
+
+    def read_lines(self, path):
+        if path == '-':
+            yield from sys.stdin
+            return
+        try:
+            with open(path, encoding='utf-8') as f:
+                yield from f
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
+
+    def insert(self, batch):
+        if batch and not self.dry_run:
+            with transaction.atomic():
+                Word.objects.bulk_create(batch, ignore_conflicts=True)
+        return len(batch)
+
+    def deactivate(self, words):
+        if self.dry_run:
+            return len(words)
+        with transaction.atomic():
+            return Word.objects.filter(word__in=words, is_active=True).update(is_active=False)
+
+    def report(self, message, lines=None):
+        elapsed = time.monotonic() - self.started
+        rate = f', {lines / elapsed:,.0f} lines/s' if lines and elapsed else ''
+        self.stdout.write(f'{message} ({elapsed:.1f}s{rate})')
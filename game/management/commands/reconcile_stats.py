@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from game.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Rebuild UserProfile statistics from the Game table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of profiles to rebuild per batch',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        user_ids = UserProfile.objects.order_by('user_id').values_list('user_id', flat=True)
+
+        updated = 0
+        last_id = 0
+        while True:
+            batch = list(user_ids.filter(user_id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            updated += UserProfile.rebuild_stats(batch)
+            last_id = batch[-1]
+            self.stdout.write(f'Rebuilt {updated} profiles...')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'\nSummary: {updated} profiles reconciled')
+        )
@@ -0,0 +1,94 @@
+import random
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from game.models import Word, WordSchedule
+
+
+class Command(BaseCommand):
+    help = 'Precompute the words of the day for daily-word mode (GAME_DAILY_WORD)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Number of days to schedule',
+        )
+        parser.add_argument(
+            '--start',
+            type=date.fromisoformat,
+            help='First day to schedule, as YYYY-MM-DD (default today)',
+        )
+        parser.add_argument(
+            '--replace',
+            action='store_true',
+            help='Overwrite existing entries instead of only filling gaps (future days only)',
+        )
+        parser.add_argument(
+            '--gap',
+            type=int,
+            default=365,
+            help='Avoid repeating words scheduled within this many days before the start',
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        start = options['start'] or today
+        if options['replace'] and start <= today:
+            raise CommandError('--replace only applies to future days; pass a --start after today.')
+
+        word_ids = list(Word.objects.filter(is_active=True).values_list('id', flat=True))
+        if not word_ids:
+            raise CommandError('No active words to schedule.')
+
+        # Shuffle recently scheduled words to the back of the deck
+        recent = set(
+            WordSchedule.objects.filter(
+                date__gte=start - timedelta(days=options['gap']), date__lt=start,
+            ).values_list('word_id', flat=True)
+        )
+        deck = []
+
+        def next_word():
+            if not deck:
+                fresh = [i for i in word_ids if i not in recent]
+                stale = [i for i in word_ids if i in recent]
+                random.shuffle(fresh)
+                random.shuffle(stale)
+                # Popped from the end, so the fresh words go last in the list
+                deck.extend(stale + fresh)
+                recent.clear()
+            return deck.pop()
+
+        slots = settings.GAMES_PER_DAY
+        entries = [
+            WordSchedule(date=start + timedelta(days=day), slot=slot, word_id=next_word())
+            for day in range(options['days'])
+            for slot in range(slots)
+        ]
+
+        end = start + timedelta(days=options['days'] - 1)
+        existing = WordSchedule.objects.filter(date__gte=start, date__lte=end).count()
+        with transaction.atomic():
+            if options['replace']:
+                WordSchedule.objects.bulk_create(
+                    entries, batch_size=1000,
+                    update_conflicts=True, unique_fields=['date', 'slot'], update_fields=['word'],
+                )
+                written = len(entries)
+            else:
+                WordSchedule.objects.bulk_create(entries, batch_size=1000, ignore_conflicts=True)
+                written = len(entries) - existing
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\nSummary: {written} entries written for {start} to {end} '
+                f'({slots} words per day, {len(word_ids)} active words), '
+                f'{0 if options["replace"] else existing} existing entries kept'
+            )
+        )
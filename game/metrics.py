@@ -0,0 +1,237 @@
+"""Gameplay counters and histograms for the /metrics endpoint.
+
+Each worker process writes its own small file, ``metrics_<pid>.db`` in
+``GAME_METRICS_DIR``. The file is memory-mapped as a fixed array of
+doubles, one slot per counter value, histogram bucket and sum. Updates are
+a locked in-place add on that array, with no system call. The endpoint
+sums the slots of every file in the directory and renders them in the
+Prometheus text exposition format. Counts from all gunicorn workers are
+therefore added up, including workers that have since exited.
+
+So that worker restarts do not leave an ever-growing number of files, each
+read first folds the files of exited processes into ``metrics_compacted.db``
+and deletes them. This runs under a lock file and needs ``fcntl``, so it is
+skipped on Windows, where the development server is a single process anyway.
+"""
+import glob
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from django.conf import settings
+
+MAGIC = b'GTWMET01'
+HEADER = struct.Struct('<8sQ')
+
+_metrics = []
+_slots = 0
+
+
+def _allocate(count):
+    global _slots
+    start = _slots
+    _slots += count
+    return start
+
+
+class Counter:
+    """Monotonic counter, optionally split by the values of one label"""
+    kind = 'counter'
+
+    def __init__(self, name, help, label=None, values=()):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values = list(values) or [None]
+        self.start = _allocate(len(self.values))
+        _metrics.append(self)
+
+    def inc(self, amount=1, value=None):
+        _add(self.start + self.values.index(value), amount)
+
+    def samples(self, slots):
+        for i, value in enumerate(self.values):
+            labels = f'{{{self.label}="{value}"}}' if self.label else ''
+            yield f'{self.name}{labels}', slots[self.start + i]
+
+
+class Histogram:
+    """Histogram with fixed bucket upper bounds"""
+    kind = 'histogram'
+
+    def __init__(self, name, help, buckets):
+        self.name = name
+        self.help = help
+        self.buckets = list(buckets)
+        # One slot per bucket plus +Inf, then the sum
+        self.start = _allocate(len(self.buckets) + 2)
+        _metrics.append(self)
+
+    def observe(self, amount):
+        index = next((i for i, bound in enumerate(self.buckets) if amount <= bound), len(self.buckets))
+        _add(self.start + index, 1, self.start + len(self.buckets) + 1, amount)
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def samples(self, slots):
+        cumulative = 0
+        for i, bound in enumerate(self.buckets + [math.inf]):
+            cumulative += slots[self.start + i]
+            le = '+Inf' if bound == math.inf else repr(float(bound))
+            yield f'{self.name}_bucket{{le="{le}"}}', cumulative
+        yield f'{self.name}_sum', slots[self.start + len(self.buckets) + 1]
+        yield f'{self.name}_count', cumulative
+
+
+games_started = Counter('game_games_started_total', 'Games started.')
+games_completed = Counter('game_games_completed_total', 'Games finished, by result.', 'result', ['won', 'lost'])
+guesses = Counter('game_guesses_total', 'Guesses submitted.')
+hints_used = Counter('game_hints_used_total', 'Hints revealed.')
+guesses_per_game = Histogram('game_guesses_per_game', 'Guesses used in finished games.', range(1, 7))
+guess_seconds = Histogram(
+    'game_guess_submit_seconds', 'Time to record and score a guess.',
+    [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1],
+)
+
+
+_lock = threading.Lock()
+_store = None
+_store_key = None
+
+
+def _open():
+    """The current process's slot array, created on first use and after a fork"""
+    global _store, _store_key
+    key = (os.getpid(), str(settings.GAME_METRICS_DIR))
+    if _store_key != key:
+        directory = key[1]
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f'metrics_{key[0]}.db')
+        size = HEADER.size + _slots * 8
+        with open(path, 'a+b') as f:
+            if os.path.getsize(path) != size:
+                f.truncate(0)
+                f.write(HEADER.pack(MAGIC, _slots) + bytes(_slots * 8))
+                f.flush()
+            mapped = mmap.mmap(f.fileno(), size)
+        _store = memoryview(mapped)[HEADER.size:].cast('d')
+        _store_key = key
+    return _store
+
+
+def _add(*pairs):
+    """Add amounts to slots: _add(slot, amount, slot, amount, ...)"""
+    with _lock:
+        store = _open()
+        for i in range(0, len(pairs), 2):
+            store[pairs[i]] += pairs[i + 1]
+
+
+COMPACTED_FILE = 'metrics_compacted.db'
+_PID_FILE = re.compile(r'metrics_(\d+)\.db$')
+
+
+def _read(path):
+    """The slots stored in a file, or None when it was left by a different version of this module"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    if len(data) != HEADER.size + _slots * 8 or HEADER.unpack_from(data) != (MAGIC, _slots):
+        return None
+    return struct.unpack_from(f'{_slots}d', data, HEADER.size)
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _compact(directory):
+    """Fold the files of exited processes into the compacted file and delete them"""
+    dead = []
+    for path in glob.glob(os.path.join(directory, 'metrics_*.db')):
+        match = _PID_FILE.search(os.path.basename(path))
+        if match and int(match.group(1)) != os.getpid() and not _alive(int(match.group(1))):
+            dead.append(path)
+    if not dead:
+        return
+
+    compacted = os.path.join(directory, COMPACTED_FILE)
+    totals = list(_read(compacted) or [0.0] * _slots)
+    merged = []
+    for path in dead:
+        slots = _read(path)
+        if slots is not None:
+            totals = [total + value for total, value in zip(totals, slots)]
+            merged.append(path)
+    if not merged:
+        return
+
+    # Replace the compacted file atomically, then drop the merged files
+    partial = f'{compacted}.{os.getpid()}.tmp'
+    with open(partial, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, _slots) + struct.pack(f'{_slots}d', *totals))
+    os.replace(partial, compacted)
+    for path in merged:
+        os.unlink(path)
+
+
+def collect():
+    """Sum the slots of every process's file, compacting those of exited processes first"""
+    directory = str(settings.GAME_METRICS_DIR)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'metrics.lock'), 'a') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            _compact(directory)
+        totals = [0.0] * _slots
+        for path in glob.glob(os.path.join(directory, 'metrics_*.db')):
+            slots = _read(path)
+            if slots is None:
+                continue
+            for i, value in enumerate(slots):
+                totals[i] += value
+    return totals
+
+
+def _format(value):
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+def render():
+    """All metrics in the Prometheus text exposition format"""
+    slots = collect()
+    lines = []
+    for metric in _metrics:
+        lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        lines.extend(f'{name} {_format(value)}' for name, value in metric.samples(slots))
+
+    won, lost = (slots[games_completed.start + i] for i in range(2))
+    lines.append('# HELP game_win_ratio Share of finished games that were won.')
+    lines.append('# TYPE game_win_ratio gauge')
+    lines.append(f'game_win_ratio {_format(won / (won + lost)) if won + lost else 0}')
+    return '\n'.join(lines) + '\n'
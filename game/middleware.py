@@ -0,0 +1,70 @@
+"""Request-scoped access to the user's profile and admin role.
+
+``UserProfileMiddleware`` sets two lazy attributes on every request:
+
+``request.profile``
+    The user's ``UserProfile`` (None when logged out), loaded on first use
+    and at most once per request.
+``request.is_game_admin``
+    Whether the user may use the admin pages. Staff users need no query.
+    For everyone else the profile's ``is_admin`` flag is remembered in the
+    session for ``GAME_ROLE_CACHE_SECONDS``, so most requests skip the
+    profile lookup altogether.
+"""
+import time
+from functools import partial
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+from django.utils.functional import SimpleLazyObject
+
+from .models import UserProfile
+
+ROLE_SESSION_KEY = '_game_role'
+
+
+def get_profile(request):
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    profile, created = UserProfile.objects.get_or_create(user=user)
+    return profile
+
+
+def is_game_admin(request):
+    user = request.user
+    if not user.is_authenticated:
+        return False
+    if user.is_staff:
+        return True
+
+    now = time.time()
+    cached = request.session.get(ROLE_SESSION_KEY)
+    if cached and cached['expires'] > now:
+        return cached['is_admin']
+
+    is_admin = request.profile.is_admin
+    ttl = getattr(settings, 'GAME_ROLE_CACHE_SECONDS', 0)
+    if ttl:
+        request.session[ROLE_SESSION_KEY] = {'is_admin': is_admin, 'expires': now + ttl}
+    return is_admin
+
+
+def attach(request):
+    request.profile = SimpleLazyObject(partial(get_profile, request))
+    request.is_game_admin = SimpleLazyObject(partial(is_game_admin, request))
+
+
+@sync_and_async_middleware
+def UserProfileMiddleware(get_response):
+    """Attach the lazy profile and role to the request (works under WSGI and ASGI)"""
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            attach(request)
+            return await get_response(request)
+    else:
+        def middleware(request):
+            attach(request)
+            return get_response(request)
+    return middleware
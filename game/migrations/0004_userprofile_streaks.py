@@ -0,0 +1,28 @@
+# Generated by Django 4.2.14 on 2026-10-18 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0003_dailyplaycount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='best_streak',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='current_streak',
+            field=models.IntegerField(default=0, help_text='Consecutive games won, up to the latest game'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='total_guesses',
+            field=models.IntegerField(default=0, help_text='Guesses used across all completed games'),
+        ),
+    ]
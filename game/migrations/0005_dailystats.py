@@ -0,0 +1,40 @@
+# Generated by Django 4.2.14 on 2026-10-18 02:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0004_userprofile_streaks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('games_started', models.IntegerField(default=0)),
+                ('players_started', models.IntegerField(default=0, help_text='Distinct users who started a game')),
+                ('games_completed', models.IntegerField(default=0)),
+                ('games_won', models.IntegerField(default=0)),
+                ('players_completed', models.IntegerField(default=0, help_text='Distinct users who completed a game')),
+                ('total_guesses', models.IntegerField(default=0, help_text='Guesses used across completed games')),
+            ],
+            options={
+                'verbose_name_plural': 'daily stats',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddField(
+            model_name='dailyplaycount',
+            name='games_completed',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='dailyplaycount',
+            name='games_won',
+            field=models.IntegerField(default=0),
+        ),
+    ]
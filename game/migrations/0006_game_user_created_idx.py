@@ -0,0 +1,17 @@
+# Generated by Django 4.2.14 on 2026-10-18 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0005_dailystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='game_user_created_idx'),
+        ),
+    ]
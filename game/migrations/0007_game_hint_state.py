@@ -0,0 +1,38 @@
+# Generated by Django 4.2.14 on 2026-10-18 02:45
+
+from django.db import migrations, models
+
+
+def fill_revealed_masks(apps, schema_editor):
+    """Compute revealed_mask for games still in progress from their guesses"""
+    Game = apps.get_model('game', 'Game')
+    Guess = apps.get_model('game', 'Guess')
+    masks = {}
+    guesses = Guess.objects.filter(game__status='ACTIVE').values_list('game_id', 'feedback')
+    for game_id, feedback in guesses.iterator():
+        for i, state in enumerate(feedback or []):
+            if state == 'correct':
+                masks[game_id] = masks.get(game_id, 0) | (1 << i)
+    for game_id, mask in masks.items():
+        Game.objects.filter(id=game_id).update(revealed_mask=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0006_game_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='hint_used',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='revealed_mask',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Bit i is set once position i has been guessed correctly'),
+        ),
+        migrations.RunPython(fill_revealed_masks, migrations.RunPython.noop),
+    ]
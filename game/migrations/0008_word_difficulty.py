@@ -0,0 +1,18 @@
+# Generated by Django 4.2.14 on 2026-10-18 02:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0007_game_hint_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='difficulty',
+            field=models.FloatField(blank=True, help_text='Average candidates left after an opening guess (higher is harder)', null=True),
+        ),
+    ]
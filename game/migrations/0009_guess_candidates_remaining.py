@@ -0,0 +1,18 @@
+# Generated by Django 4.2.14 on 2026-10-18 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0008_word_difficulty'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guess',
+            name='candidates_remaining',
+            field=models.IntegerField(blank=True, help_text='Active words still consistent with the feedback so far', null=True),
+        ),
+    ]
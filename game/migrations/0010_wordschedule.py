@@ -0,0 +1,27 @@
+# Generated by Django 4.2.14 on 2026-10-18 03:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0009_guess_candidates_remaining'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('slot', models.PositiveSmallIntegerField(help_text="0-based index of the player's game that day")),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='game.word')),
+            ],
+            options={
+                'ordering': ['date', 'slot'],
+                'unique_together': {('date', 'slot')},
+            },
+        ),
+    ]
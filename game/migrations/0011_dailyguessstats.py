@@ -0,0 +1,28 @@
+# Generated by Django 4.2.14 on 2026-10-18 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0010_wordschedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyGuessStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('guess_number', models.IntegerField()),
+                ('guesses', models.IntegerField(default=0, help_text='Guesses with a candidate count')),
+                ('total_candidates', models.IntegerField(default=0, help_text='Sum of their candidates remaining')),
+            ],
+            options={
+                'verbose_name_plural': 'daily guess stats',
+                'ordering': ['date', 'guess_number'],
+                'unique_together': {('date', 'guess_number')},
+            },
+        ),
+    ]
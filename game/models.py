@@ -1,7 +1,13 @@
-from django.db import models
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Avg, Count, F, Q, Sum, Value
+from django.db.models.functions import Greatest
 from django.contrib.auth.models import User
 from django.utils import timezone
-import random
+
+from . import candidates, metrics, quota, scoring, word_pool
+from .board import get_board
 
 
 class Word(models.Model):
@@ -9,6 +15,10 @@ class Word(models.Model):
     word = models.CharField(max_length=5, unique=True, help_text="5-letter word in uppercase")
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
+    difficulty = models.FloatField(
+        null=True, blank=True,
+        help_text="Average candidates left after an opening guess (higher is harder)"
+    )
 
     def __str__(self):
         return self.word
@@ -18,11 +28,50 @@ class Word(models.Model):
 
     @classmethod
     def get_random_word(cls):
-        """Get a random active word from the database"""
-        active_words = cls.objects.filter(is_active=True)
-        if active_words.exists():
-            return random.choice(active_words)
-        return None
+        """Get a random active word using the cached pool of active word ids"""
+        return word_pool.pick_random_word()
+
+    @classmethod
+    def get_word_for_game(cls, slot):
+        """Word for a user's slot-th game today (0-based).
+
+        In daily-word mode (GAME_DAILY_WORD setting) this is the scheduled
+        word, shared by every player's game in that slot. Without a schedule
+        entry, or outside that mode, it is a random active word.
+        """
+        if settings.GAME_DAILY_WORD:
+            word = WordSchedule.word_for(timezone.localdate(), slot)
+            if word:
+                return word
+        return cls.get_random_word()
+
+
+class WordSchedule(models.Model):
+    """Precomputed words of the day, one per daily game slot"""
+    date = models.DateField()
+    slot = models.PositiveSmallIntegerField(help_text="0-based index of the player's game that day")
+    word = models.ForeignKey(Word, on_delete=models.CASCADE)
+
+    CACHE_TIMEOUT = 60 * 60
+
+    def __str__(self):
+        return f"{self.date} #{self.slot + 1}: {self.word.word}"
+
+    class Meta:
+        ordering = ['date', 'slot']
+        unique_together = ['date', 'slot']
+
+    @classmethod
+    def word_for(cls, date, slot):
+        """Scheduled active word for (date, slot), or None; cached until the word list changes"""
+        key = f'game:schedule:{word_pool.get_version()}:{date.isoformat()}:{slot}'
+        word = cache.get(key)
+        if word is None:
+            entry = cls.objects.filter(date=date, slot=slot, word__is_active=True).select_related('word').first()
+            # False caches a missing entry too
+            word = entry.word if entry else False
+            cache.set(key, word, cls.CACHE_TIMEOUT)
+        return word or None
 
 
 class Game(models.Model):
@@ -38,6 +87,10 @@ class Game(models.Model):
     status = models.CharField(max_length=10, choices=GAME_STATUS_CHOICES, default='ACTIVE')
     guesses_count = models.IntegerField(default=0)
     max_guesses = models.IntegerField(default=5)
+    revealed_mask = models.PositiveSmallIntegerField(
+        default=0, help_text="Bit i is set once position i has been guessed correctly"
+    )
+    hint_used = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
@@ -46,6 +99,33 @@ class Game(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of a user's history on (created_at, id)
+            models.Index(fields=['user', '-created_at', '-id'], name='game_user_created_idx'),
+        ]
+
+    WORD_STATS_CACHE_TIMEOUT = 60
+
+    @classmethod
+    def start_for_user(cls, user, word=None):
+        """Create a game if the user has a game left today, otherwise return None.
+
+        Without a word, the game gets Word.get_word_for_game for its slot
+        today. Raises Word.DoesNotExist when there is no active word.
+        """
+        with transaction.atomic():
+            started_today = quota.try_start_game(user)
+            if not started_today:
+                return None
+            if word is None:
+                word = Word.get_word_for_game(started_today - 1)
+                if word is None:
+                    # Rolls back the quota slot taken above
+                    raise Word.DoesNotExist('No active words to play.')
+            game = cls.objects.create(user=user, word=word)
+            DailyStats.record_game_started(game, first_today=started_today == 1)
+        metrics.games_started.inc()
+        return game
 
     def is_completed(self):
         return self.status in ['WON', 'LOST']
@@ -53,25 +133,234 @@ class Game(models.Model):
     def can_guess(self):
         return self.status == 'ACTIVE' and self.guesses_count < self.max_guesses
 
-    def complete_game(self, won=False):
-        self.status = 'WON' if won else 'LOST'
-        self.completed_at = timezone.now()
-        self.save()
+    def submit_guess(self, guess_word):
+        """Record a guess, score it and finish the game when it is won or out of guesses.
+
+        The guess slot is claimed with one conditional UPDATE on the guess
+        count this instance last saw, so concurrent submits for the same game
+        each get their own guess number, and a submit after the game ended
+        changes nothing. Returns the Guess, or None when the game no longer
+        accepts guesses.
+        """
+        with metrics.guess_seconds.time():
+            guess = self._record_guess(guess_word)
+        if guess:
+            metrics.guesses.inc()
+        return guess
+
+    def _record_guess(self, guess_word):
+        guess = Guess(game=self, guess_word=guess_word)
+        guess.generate_feedback()
+        correct_mask = guess.correct_mask()
+
+        with transaction.atomic():
+            while True:
+                guess_number = self.guesses_count + 1
+                if guess_word == self.word.word:
+                    status = 'WON'
+                elif guess_number >= self.max_guesses:
+                    status = 'LOST'
+                else:
+                    status = 'ACTIVE'
+                completed_at = timezone.now() if status != 'ACTIVE' else None
+
+                claimed = Game.objects.filter(
+                    pk=self.pk, status='ACTIVE', guesses_count=self.guesses_count,
+                    guesses_count__lt=F('max_guesses'),
+                ).update(
+                    guesses_count=F('guesses_count') + 1,
+                    revealed_mask=F('revealed_mask').bitor(correct_mask),
+                    status=status,
+                    completed_at=completed_at,
+                )
+                if claimed:
+                    break
+
+                # Another submit got in first: retry on the fresh state
+                self.refresh_from_db(fields=['status', 'guesses_count', 'max_guesses', 'revealed_mask', 'completed_at'])
+                if not self.can_guess():
+                    return None
+
+            self.guesses_count = guess_number
+            self.revealed_mask |= correct_mask
+            self.status = status
+            self.completed_at = completed_at
+
+            guess.guess_number = guess_number
+            guess.candidates_remaining = candidates.get_index().count(
+                self._previous_guesses(guess_number) + [(guess_word, guess.feedback)]
+            )
+            guess.save(force_insert=True)
+            DailyGuessStats.record_guess(self, guess)
+
+            if self.is_completed():
+                self.record_completion()
+        return guess
+
+    def _previous_guesses(self, guess_number):
+        """(word, feedback) of the guesses before guess_number"""
+        previous = [(word, feedback) for word, feedback, _ in get_board(self, guess_number - 1).guesses]
+        if len(previous) != guess_number - 1:
+            # The cached board is behind a concurrent submit
+            previous = list(
+                self.guesses.filter(guess_number__lt=guess_number)
+                .order_by('guess_number').values_list('guess_word', 'feedback')
+            )
+        return previous
+
+    def record_completion(self):
+        """Update the player's profile and the daily counters for a finished game"""
+        UserProfile.record_game_result(self.user_id, self.status == 'WON', self.guesses_count)
+        DailyStats.record_game_completed(self)
+        metrics.games_completed.inc(value=self.status.lower())
+        metrics.guesses_per_game.observe(self.guesses_count)
+
+    @classmethod
+    def word_stats(cls, word_id, date):
+        """Results of every game on word_id started on date, cached briefly and shared by all players"""
+        key = f'game:word_stats:{date.isoformat()}:{word_id}'
+        stats = cache.get(key)
+        if stats is None:
+            start, end = quota.day_bounds(date)
+            stats = cls.objects.filter(
+                word_id=word_id, created_at__gte=start, created_at__lt=end, status__in=['WON', 'LOST'],
+            ).aggregate(
+                played=Count('id'),
+                won=Count('id', filter=Q(status='WON')),
+                average_guesses=Avg('guesses_count', filter=Q(status='WON')),
+            )
+            stats['win_rate'] = round(stats['won'] / stats['played'] * 100) if stats['played'] else 0
+            cache.set(key, stats, cls.WORD_STATS_CACHE_TIMEOUT)
+        return stats
+
+
+class DailyPlayCount(models.Model):
+    """Per-user daily game counts, used for the daily quota and user reports"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    date = models.DateField()
+    games_started = models.IntegerField(default=0)
+    games_completed = models.IntegerField(default=0)
+    games_won = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date}: {self.games_started}"
+
+    class Meta:
+        unique_together = ['user', 'date']
+
+    @staticmethod
+    def game_counts():
+        """Aggregates that rebuild the counters from a queryset of games"""
+        return {
+            'games_started': Count('id'),
+            'games_completed': Count('id', filter=Q(status__in=['WON', 'LOST'])),
+            'games_won': Count('id', filter=Q(status='WON')),
+        }
+
+
+class DailyStats(models.Model):
+    """Daily rollup of game activity, keyed by the date games were started"""
+    date = models.DateField(unique=True)
+    games_started = models.IntegerField(default=0)
+    players_started = models.IntegerField(default=0, help_text="Distinct users who started a game")
+    games_completed = models.IntegerField(default=0)
+    games_won = models.IntegerField(default=0)
+    players_completed = models.IntegerField(default=0, help_text="Distinct users who completed a game")
+    total_guesses = models.IntegerField(default=0, help_text="Guesses used across completed games")
+
+    def __str__(self):
+        return f"{self.date}: {self.games_completed} games"
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name_plural = 'daily stats'
+
+    def success_rate(self):
+        if self.games_completed == 0:
+            return 0
+        return round((self.games_won / self.games_completed) * 100, 2)
+
+    @classmethod
+    def for_date(cls, date):
+        """Return the rollup for a date, or an unsaved empty row"""
+        return cls.objects.filter(date=date).first() or cls(date=date)
+
+    @classmethod
+    def increment(cls, date, **counts):
+        """Atomically add counts to the row for date, creating it if needed"""
+        changes = {field: F(field) + value for field, value in counts.items()}
+        if not cls.objects.filter(date=date).update(**changes):
+            cls.objects.get_or_create(date=date)
+            cls.objects.filter(date=date).update(**changes)
+
+    @classmethod
+    def record_game_started(cls, game, first_today):
+        cls.increment(
+            timezone.localdate(game.created_at),
+            games_started=1,
+            players_started=int(first_today),
+        )
 
     @classmethod
-    def get_user_games_today(cls, user):
-        """Get games played by user today"""
-        today = timezone.now().date()
-        return cls.objects.filter(
-            user=user,
-            created_at__date=today
+    def record_game_completed(cls, game):
+        date = timezone.localdate(game.created_at)
+        won = int(game.status == 'WON')
+        counters = DailyPlayCount.objects.filter(user_id=game.user_id, date=date)
+
+        # The first completion of the day also counts the player
+        first = counters.filter(games_completed=0).update(games_completed=1, games_won=won)
+        if not first and not counters.update(
+            games_completed=F('games_completed') + 1,
+            games_won=F('games_won') + won,
+        ):
+            _, first = DailyPlayCount.objects.get_or_create(
+                user_id=game.user_id, date=date,
+                defaults={'games_started': 1, 'games_completed': 1, 'games_won': won},
+            )
+
+        cls.increment(
+            date,
+            games_completed=1,
+            games_won=won,
+            players_completed=int(bool(first)),
+            total_guesses=game.guesses_count,
         )
 
+
+class DailyGuessStats(models.Model):
+    """Daily rollup of candidate counts per guess number, keyed by the date games were started"""
+    date = models.DateField()
+    guess_number = models.IntegerField()
+    guesses = models.IntegerField(default=0, help_text="Guesses with a candidate count")
+    total_candidates = models.IntegerField(default=0, help_text="Sum of their candidates remaining")
+
+    def __str__(self):
+        return f"{self.date}: guess {self.guess_number}"
+
+    class Meta:
+        ordering = ['date', 'guess_number']
+        unique_together = ['date', 'guess_number']
+        verbose_name_plural = 'daily guess stats'
+
     @classmethod
-    def can_user_play_today(cls, user):
-        """Check if user can play more games today (max 3 per day)"""
-        games_today = cls.get_user_games_today(user).count()
-        return games_today < 3
+    def record_guess(cls, game, guess):
+        date = timezone.localdate(game.created_at)
+        rows = cls.objects.filter(date=date, guess_number=guess.guess_number)
+        changes = {
+            'guesses': F('guesses') + 1,
+            'total_candidates': F('total_candidates') + guess.candidates_remaining,
+        }
+        if not rows.update(**changes):
+            cls.objects.get_or_create(date=date, guess_number=guess.guess_number)
+            rows.update(**changes)
+
+    @classmethod
+    def averages(cls, date):
+        """(guess_number, average candidates remaining) for games started on date"""
+        return [
+            (row.guess_number, round(row.total_candidates / row.guesses, 1))
+            for row in cls.objects.filter(date=date, guesses__gt=0)
+        ]
 
 
 class Guess(models.Model):
@@ -80,6 +369,9 @@ class Guess(models.Model):
     guess_word = models.CharField(max_length=5, help_text="5-letter guess in uppercase")
     guess_number = models.IntegerField()
     feedback = models.JSONField(help_text="Feedback for each letter: correct, wrong_position, incorrect", default=list)
+    candidates_remaining = models.IntegerField(
+        null=True, blank=True, help_text="Active words still consistent with the feedback so far"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -89,36 +381,19 @@ class Guess(models.Model):
         ordering = ['guess_number']
         unique_together = ['game', 'guess_number']
 
+    def correct_mask(self):
+        """Bitmask of the positions this guess got right"""
+        mask = 0
+        for i, state in enumerate(self.feedback):
+            if state == 'correct':
+                mask |= 1 << i
+        return mask
+
     def generate_feedback(self):
         """Generate feedback for the guess compared to the target word"""
-        target_word = self.game.word.word
-        guess_word = self.guess_word
-        feedback = []
-
-        # Count letters in target word for wrong position detection
-        target_letter_count = {}
-        for letter in target_word:
-            target_letter_count[letter] = target_letter_count.get(letter, 0) + 1
-
-        # First pass: mark correct positions
-        for i in range(5):
-            if guess_word[i] == target_word[i]:
-                feedback.append('correct')
-                target_letter_count[guess_word[i]] -= 1
-            else:
-                feedback.append('pending')
-
-        # Second pass: mark wrong positions and incorrect
-        for i in range(5):
-            if feedback[i] == 'pending':
-                if guess_word[i] in target_letter_count and target_letter_count[guess_word[i]] > 0:
-                    feedback[i] = 'wrong_position'
-                    target_letter_count[guess_word[i]] -= 1
-                else:
-                    feedback[i] = 'incorrect'
-
-        self.feedback = feedback
-        return feedback
+        pattern = scoring.score(self.guess_word, self.game.word.word)
+        self.feedback = scoring.decode_pattern(pattern)
+        return self.feedback
 
 
 class UserProfile(models.Model):
@@ -127,8 +402,13 @@ class UserProfile(models.Model):
     is_admin = models.BooleanField(default=False)
     games_played = models.IntegerField(default=0)
     games_won = models.IntegerField(default=0)
+    total_guesses = models.IntegerField(default=0, help_text="Guesses used across all completed games")
+    current_streak = models.IntegerField(default=0, help_text="Consecutive games won, up to the latest game")
+    best_streak = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    STATS_FIELDS = ['games_played', 'games_won', 'total_guesses', 'current_streak', 'best_streak']
+
     def __str__(self):
         return f"{self.user.username} - {'Admin' if self.is_admin else 'Player'}"
 
@@ -137,9 +417,59 @@ class UserProfile(models.Model):
             return 0
         return round((self.games_won / self.games_played) * 100, 2)
 
-    def update_stats(self):
-        """Update user statistics based on completed games"""
-        user_games = Game.objects.filter(user=self.user, status__in=['WON', 'LOST'])
-        self.games_played = user_games.count()
-        self.games_won = user_games.filter(status='WON').count()
-        self.save()
+    def average_guesses(self):
+        if self.games_played == 0:
+            return 0
+        return round(self.total_guesses / self.games_played, 2)
+
+    @classmethod
+    def record_game_result(cls, user, won, guesses):
+        """Add one completed game to the user's statistics in a single UPDATE"""
+        # best_streak is listed first so it reads the old current_streak on
+        # backends that apply SET clauses in order
+        if won:
+            streaks = {
+                'best_streak': Greatest('best_streak', F('current_streak') + 1),
+                'current_streak': F('current_streak') + 1,
+            }
+        else:
+            streaks = {'current_streak': Value(0)}
+        return cls.objects.filter(user=user).update(
+            games_played=F('games_played') + 1,
+            games_won=F('games_won') + int(won),
+            total_guesses=F('total_guesses') + guesses,
+            **streaks,
+        )
+
+    @classmethod
+    def rebuild_stats(cls, user_ids):
+        """Recompute statistics from the Game table for the given users"""
+        totals = {
+            row['user_id']: row
+            for row in Game.objects.filter(user_id__in=user_ids, status__in=['WON', 'LOST'])
+            .values('user_id')
+            .annotate(
+                played=Count('id'),
+                won=Count('id', filter=Q(status='WON')),
+                guesses=Sum('guesses_count'),
+            )
+        }
+
+        streaks = {}
+        results = Game.objects.filter(user_id__in=user_ids, status__in=['WON', 'LOST']).order_by(
+            'user_id', 'completed_at', 'id'
+        ).values_list('user_id', 'status')
+        for user_id, status in results.iterator():
+            current, best = streaks.get(user_id, (0, 0))
+            current = current + 1 if status == 'WON' else 0
+            streaks[user_id] = (current, max(best, current))
+
+        profiles = list(cls.objects.filter(user_id__in=user_ids))
+        for profile in profiles:
+            row = totals.get(profile.user_id, {})
+            profile.games_played = row.get('played', 0)
+            profile.games_won = row.get('won', 0)
+            profile.total_guesses = row.get('guesses') or 0
+            profile.current_streak, profile.best_streak = streaks.get(profile.user_id, (0, 0))
+        cls.objects.bulk_update(profiles, cls.STATS_FIELDS)
+        return len(profiles)
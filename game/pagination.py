@@ -0,0 +1,43 @@
+"""Keyset (cursor) pagination on ``(created_at, id)``.
+
+Pages are fetched with ``WHERE (created_at, id) < cursor ORDER BY
+created_at DESC, id DESC LIMIT n``, so every page costs the same index range
+scan no matter how deep into the history it is. The cursor is the
+``created_at`` and ``id`` of the last row on the previous page, encoded as an
+opaque URL-safe token.
+"""
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.encoding import force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+
+def encode_cursor(obj):
+    return urlsafe_base64_encode(f'{obj.created_at.isoformat()}|{obj.pk}'.encode())
+
+
+def decode_cursor(cursor):
+    """Return (created_at, id) for a cursor token, or None if it is invalid"""
+    try:
+        created_at, pk = force_str(urlsafe_base64_decode(cursor)).split('|')
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, TypeError):
+        return None
+
+
+def keyset_page(queryset, cursor=None, page_size=25):
+    """Return (objects, next_cursor) for the page after cursor, newest first.
+
+    next_cursor is None on the last page.
+    """
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        created_at, pk = position
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+
+    objects = list(queryset.order_by('-created_at', '-pk')[:page_size + 1])
+    if len(objects) > page_size:
+        objects = objects[:page_size]
+        return objects, encode_cursor(objects[-1])
+    return objects, None
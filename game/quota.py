@@ -0,0 +1,67 @@
+"""Daily game quota backed by per-user, per-day counters.
+
+Each user has one ``DailyPlayCount`` row per day. Starting a game consumes
+a slot with a single conditional ``UPDATE ... WHERE games_started < limit``,
+so concurrent requests can never push a user past the limit. Reading the
+count is one lookup on the ``(user, date)`` unique index. When a user has no
+row for today yet, it is seeded from that day's ``Game`` rows, which keeps
+the quota correct for games created before the counters existed.
+"""
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+
+def daily_limit():
+    return settings.GAMES_PER_DAY
+
+
+def day_bounds(date):
+    """Aware datetimes for the start of date and of the next day"""
+    start = timezone.make_aware(datetime.combine(date, time.min))
+    return start, start + timedelta(days=1)
+
+
+def _get_or_seed(user, date):
+    """Return today's counter row, creating it from the Game table if missing"""
+    from .models import DailyPlayCount, Game
+    start, end = day_bounds(date)
+    counts = Game.objects.filter(user=user, created_at__gte=start, created_at__lt=end).aggregate(
+        **DailyPlayCount.game_counts()
+    )
+    counter, _ = DailyPlayCount.objects.get_or_create(user=user, date=date, defaults=counts)
+    return counter
+
+
+def games_started_today(user):
+    """Number of games the user has started today"""
+    from .models import DailyPlayCount
+    today = timezone.localdate()
+    started = DailyPlayCount.objects.filter(user=user, date=today).values_list(
+        'games_started', flat=True
+    ).first()
+    if started is None:
+        started = _get_or_seed(user, today).games_started
+    return started
+
+
+def try_start_game(user):
+    """Atomically consume one of today's game slots.
+
+    Returns the number of games started today including this one, or 0 when
+    the user has reached the limit. Call it inside the transaction that
+    creates the game so the slot is given back if that fails.
+    """
+    from .models import DailyPlayCount
+    today = timezone.localdate()
+    counters = DailyPlayCount.objects.filter(user=user, date=today)
+    available = counters.filter(games_started__lt=daily_limit())
+    if not available.update(games_started=F('games_started') + 1):
+        # No slot was taken: either the limit is reached or today's row is missing
+        if _get_or_seed(user, today).games_started >= daily_limit():
+            return 0
+        if not available.update(games_started=F('games_started') + 1):
+            return 0
+    return counters.values_list('games_started', flat=True).get()
@@ -0,0 +1,142 @@
+"""Feedback scoring engine.
+
+Feedback for a guess is encoded as a single integer pattern: each position
+contributes a base-3 digit (0 = incorrect, 1 = wrong position, 2 = correct),
+with position 0 as the least significant digit. A 5-letter word therefore has
+3 ** 5 = 243 possible patterns, which fit in a ``uint8``.
+
+``score`` handles one (guess, target) pair in pure Python and is what
+``Guess.generate_feedback`` uses. ``score_many`` and ``score_matrix`` score
+whole NumPy arrays of pairs at once for analytics and replay jobs.
+"""
+import numpy as np
+
+WORD_LENGTH = 5
+ALPHABET_SIZE = 26
+
+INCORRECT = 0
+WRONG_POSITION = 1
+CORRECT = 2
+
+STATES = ('incorrect', 'wrong_position', 'correct')
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+NUM_PATTERNS = 3 ** WORD_LENGTH
+ALL_CORRECT = NUM_PATTERNS - 1
+
+_WEIGHTS = np.array([3 ** i for i in range(WORD_LENGTH)], dtype=np.uint16)
+
+# _EARLIER[i, j] is True when position j comes before position i
+_EARLIER = np.tri(WORD_LENGTH, k=-1, dtype=bool)
+
+# Number of (guess, target) pairs scored per NumPy chunk in score_matrix
+CHUNK_PAIRS = 1 << 18
+
+
+def score(guess, target):
+    """Return the feedback pattern for a single guess against a target word"""
+    states = [INCORRECT] * WORD_LENGTH
+    remaining = {}
+
+    # First pass: mark correct positions and count the unmatched target letters
+    for i in range(WORD_LENGTH):
+        if guess[i] == target[i]:
+            states[i] = CORRECT
+        else:
+            remaining[target[i]] = remaining.get(target[i], 0) + 1
+
+    # Second pass: mark wrong positions while unmatched letters remain
+    for i in range(WORD_LENGTH):
+        if states[i] != CORRECT and remaining.get(guess[i], 0) > 0:
+            states[i] = WRONG_POSITION
+            remaining[guess[i]] -= 1
+
+    return encode_states(states)
+
+
+def encode_states(states):
+    """Pack a sequence of per-position state codes into a pattern"""
+    pattern = 0
+    for i, state in enumerate(states):
+        pattern += state * 3 ** i
+    return pattern
+
+
+def encode_feedback(feedback):
+    """Convert a list of feedback strings (as stored on Guess) to a pattern"""
+    return encode_states([STATE_CODES[state] for state in feedback])
+
+
+def decode_pattern(pattern):
+    """Convert a pattern back to the list of feedback strings stored on Guess"""
+    feedback = []
+    for _ in range(WORD_LENGTH):
+        pattern, state = divmod(pattern, 3)
+        feedback.append(STATES[state])
+    return feedback
+
+
+def encode_words(words):
+    """Encode uppercase words as an (N, 5) uint8 array of letter indexes"""
+    if isinstance(words, np.ndarray):
+        return words
+    joined = ''.join(words).encode('ascii')
+    letters = np.frombuffer(joined, dtype=np.uint8) - ord('A')
+    return letters.reshape(-1, WORD_LENGTH)
+
+
+def score_many(guesses, targets):
+    """Score many (guess, target) pairs at once.
+
+    ``guesses`` and ``targets`` are equal-length sequences of words or
+    arrays from ``encode_words``. Returns a uint8 array of patterns.
+    """
+    guesses = encode_words(guesses)
+    targets = encode_words(targets)
+    if guesses.shape != targets.shape:
+        raise ValueError('guesses and targets must have the same shape')
+
+    green = guesses == targets
+    unmatched = ~green[:, None, :]
+
+    # A guess letter is in the wrong position when the target still has more
+    # unmatched copies of it than earlier unmatched guess positions used up
+    available = ((guesses[:, :, None] == targets[:, None, :]) & unmatched).sum(axis=2)
+    earlier = ((guesses[:, :, None] == guesses[:, None, :]) & unmatched & _EARLIER).sum(axis=2)
+    yellow = ~green & (earlier < available)
+
+    states = green.astype(np.uint8) * CORRECT + yellow
+    return (states @ _WEIGHTS).astype(np.uint8)
+
+
+def score_matrix(guesses, targets):
+    """Score every guess against every target.
+
+    Returns a (len(guesses), len(targets)) uint8 array of patterns. Works a
+    block of guesses at a time against all targets, so the per-target letter
+    counts and per-guess repeated-letter masks are computed only once.
+    """
+    guesses = encode_words(guesses)
+    targets = encode_words(targets)
+    matrix = np.empty((len(guesses), len(targets)), dtype=np.uint8)
+    if not len(targets):
+        return matrix
+
+    letters = np.arange(ALPHABET_SIZE, dtype=np.uint8)
+    target_counts = (targets[:, :, None] == letters).sum(axis=1).astype(np.int8)
+
+    step = max(1, CHUNK_PAIRS // len(targets))
+    for start in range(0, len(guesses), step):
+        block = guesses[start:start + step]
+        same = (block[:, :, None] == block[:, None, :]).astype(np.int8)
+        green = block[:, None, :] == targets[None, :, :]
+        green_counts = green.astype(np.int8)
+
+        # Same rule as score_many, using target letter counts minus greens
+        available = target_counts[:, block].transpose(1, 0, 2) - green_counts @ same
+        earlier = (1 - green_counts) @ (same * _EARLIER).transpose(0, 2, 1)
+        yellow = ~green & (earlier < available)
+
+        states = (green_counts * CORRECT + yellow).astype(np.uint8)
+        matrix[start:start + len(block)] = states @ _WEIGHTS
+    return matrix
@@ -1,17 +1,39 @@
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from .models import UserProfile
+from . import board, word_pool
+from .models import Guess, UserProfile, Word
 
 
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
+def create_user_profile(sender, instance, created, update_fields=None, **kwargs):
     if created:
         UserProfile.objects.create(user=instance)
+    elif update_fields is None:
+        # Ensure a profile exists after full saves, such as admin edits.
+        # Partial saves, like the last_login update on every login, skip it.
+        UserProfile.objects.get_or_create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    # Ensure a profile always exists and is saved
-    UserProfile.objects.get_or_create(user=instance)
+@receiver(post_save, sender=Word)
+@receiver(post_delete, sender=Word)
+def invalidate_word_caches(sender, **kwargs):
+    word_pool.invalidate()
+
+
+@receiver(post_save, sender=Guess)
+@receiver(post_delete, sender=Guess)
+def invalidate_game_board(sender, instance, **kwargs):
+    board.invalidate_board(instance.game_id, instance.guess_number)
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
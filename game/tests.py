@@ -0,0 +1,114 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.db import connections
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from django.urls import include, path
+
+from . import async_views, dictionary
+from .models import DailyPlayCount, Game, Word
+
+CONCURRENT_REQUESTS = 8
+
+
+class AsyncGameplayURLs:
+    """The URLconf game/urls.py builds when GAME_ASYNC_VIEWS is on"""
+    urlpatterns = [
+        path('play/<int:game_id>/', async_views.play_game, name='play_game'),
+        path('', include('game.urls')),
+    ]
+
+
+@override_settings(ROOT_URLCONF=AsyncGameplayURLs)
+class AsyncPlayGameTests(TestCase):
+    """Guesses posted to the async play view"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'dictionary.bin')
+        dictionary.write_index(path, ['APPLE', 'CRANE'])
+        settings_override = override_settings(
+            GUESS_DICTIONARY_PATH=path, WORD_LIST_VERSION_PATH=os.path.join(tmp.name, 'word_list.version'),
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        dictionary.reset()
+        self.addCleanup(dictionary.reset)
+
+        Word.objects.create(word='BRAVE')
+        user = User.objects.create_user('player', password='Zebra*Quartz42')
+        self.game = Game.objects.create(user=user, word=Word.objects.create(word='APPLE'))
+        self.client.force_login(user)
+        self.async_client = AsyncClient()
+        self.async_client.cookies = self.client.cookies
+
+    async def test_guess_missing_from_index_is_checked_against_word_table(self):
+        response = await self.async_client.post(f'/play/{self.game.id}/', {'guess': 'BRAVE'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(await self.game.guesses.acount(), 1)
+
+    async def test_unknown_guess_is_rejected(self):
+        response = await self.async_client.post(f'/play/{self.game.id}/', {'guess': 'ZZZZZ'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['form'].errors['guess'], ['"ZZZZZ" is not in the word list.'])
+        self.assertEqual(await self.game.guesses.acount(), 0)
+
+
+def run_concurrently(func, count=CONCURRENT_REQUESTS):
+    """Call func from count threads released at the same moment; return the results"""
+    barrier = threading.Barrier(count)
+
+    def call(_):
+        try:
+            barrier.wait()
+            return func()
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(count) as pool:
+        return list(pool.map(call, range(count)))
+
+
+class ConcurrencyTests(TransactionTestCase):
+    """Races between requests for the same player or game"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(
+            GUESS_DICTIONARY_PATH=os.path.join(tmp.name, 'missing.bin'),
+            WORD_LIST_VERSION_PATH=os.path.join(tmp.name, 'word_list.version'),
+            GAME_METRICS_DIR=os.path.join(tmp.name, 'metrics'),
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user('player', password='Zebra*Quartz42')
+        self.word = Word.objects.create(word='APPLE')
+        Word.objects.create(word='CRANE')
+
+    @override_settings(GAMES_PER_DAY=3)
+    def test_concurrent_starts_stay_within_daily_limit(self):
+        games = run_concurrently(lambda: Game.start_for_user(self.user))
+
+        self.assertEqual(sum(game is not None for game in games), 3)
+        self.assertEqual(Game.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(DailyPlayCount.objects.get(user=self.user).games_started, 3)
+
+    def test_double_submit_records_one_guess_per_slot(self):
+        game = Game.objects.create(user=self.user, word=self.word)
+
+        # Each request loads its own copy of the game, as the views do
+        guesses = run_concurrently(lambda: Game.objects.select_related('word').get(pk=game.pk).submit_guess('CRANE'))
+
+        recorded = [guess for guess in guesses if guess is not None]
+        self.assertEqual(sorted(guess.guess_number for guess in recorded), list(range(1, game.max_guesses + 1)))
+        self.assertEqual(guesses.count(None), CONCURRENT_REQUESTS - game.max_guesses)
+        game.refresh_from_db()
+        self.assertEqual(game.guesses_count, game.max_guesses)
+        self.assertEqual(game.status, 'LOST')
+        self.assertEqual(game.guesses.count(), game.max_guesses)
@@ -0,0 +1,184 @@
+"""Opt-in per-view timing with Server-Timing headers.
+
+When the GAME_TIMING setting is on, ``TimingMiddleware`` measures each
+request's wall time, SQL query count and time, and template render time.
+It adds them to the response as a ``Server-Timing`` header, which browser
+dev tools show in the network panel. The same figures are kept in a
+rolling window per view, and the staff-only timings page reads them from
+there.
+
+When the setting is off, the middleware raises ``MiddlewareNotUsed``.
+Django then drops it from the chain, and the template renderer is never
+wrapped, so there is no overhead at all.
+
+The middleware works under WSGI and ASGI. For async requests the query
+wrapper is installed in the thread that runs the request's sync code,
+since database connections belong to a thread.
+
+The windows are held in process memory, so with several worker processes
+each process reports its own requests.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.decorators import sync_and_async_middleware
+
+from .benchmarking import percentile
+
+WINDOW_SIZE = 500
+
+# Upper bounds, in milliseconds, of the histogram buckets on the timings page
+BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000]
+
+_current = ContextVar('game_request_timing', default=None)
+
+
+class RequestTiming:
+    """Figures collected while one request is handled"""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql = 0.0
+        self.template = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # Database execute wrapper: time every query
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql += time.perf_counter() - started
+
+
+class ViewTimings:
+    """Rolling window of the latest requests to each view"""
+
+    def __init__(self, size=WINDOW_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=self.size))
+
+    def record(self, view, total, timing):
+        with self.lock:
+            self.samples[view].append((total * 1000, timing.queries, timing.sql * 1000, timing.template * 1000))
+
+    def summary(self):
+        """Per-view percentiles, averages and histogram counts, slowest view first"""
+        with self.lock:
+            samples = {view: list(rows) for view, rows in self.samples.items()}
+
+        rows = []
+        for view, window in samples.items():
+            totals = [sample[0] for sample in window]
+            counts = [0] * (len(BUCKETS) + 1)
+            for total in totals:
+                counts[next((i for i, bound in enumerate(BUCKETS) if total <= bound), len(BUCKETS))] += 1
+            rows.append({
+                'view': view,
+                'requests': len(window),
+                'p50': percentile(totals, 50),
+                'p95': percentile(totals, 95),
+                'p99': percentile(totals, 99),
+                'queries': sum(sample[1] for sample in window) / len(window),
+                'sql': sum(sample[2] for sample in window) / len(window),
+                'template': sum(sample[3] for sample in window) / len(window),
+                'histogram': counts,
+            })
+        return sorted(rows, key=lambda row: row['p95'], reverse=True)
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+
+
+timings = ViewTimings()
+
+
+def _time_template_rendering():
+    """Wrap the Django template backend so top-level renders count towards the current request"""
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, 'timed', False):
+        return
+    render = Template.render
+
+    def timed_render(self, context=None, request=None):
+        timing = _current.get()
+        if timing is None:
+            return render(self, context, request)
+        started = time.perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            timing.template += time.perf_counter() - started
+
+    timed_render.timed = True
+    Template.render = timed_render
+
+
+def server_timing(total, timing):
+    return (
+        f'total;dur={total * 1000:.1f}, '
+        f'sql;desc="{timing.queries} queries";dur={timing.sql * 1000:.1f}, '
+        f'template;dur={timing.template * 1000:.1f}'
+    )
+
+
+def _wrap_connections(stack, timing):
+    # Connections are per thread, so this runs in the thread that makes the queries
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(timing))
+
+
+def _finish(request, response, started, timing):
+    total = time.perf_counter() - started
+    match = request.resolver_match
+    timings.record(match.view_name if match else 'unresolved', total, timing)
+    response['Server-Timing'] = server_timing(total, timing)
+    return response
+
+
+@sync_and_async_middleware
+def TimingMiddleware(get_response):
+    """Time each request and report it in a Server-Timing header (GAME_TIMING setting)"""
+    if not getattr(settings, 'GAME_TIMING', False):
+        raise MiddlewareNotUsed
+    _time_template_rendering()
+
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            timing = RequestTiming()
+            token = _current.set(timing)
+            started = time.perf_counter()
+            stack = ExitStack()
+            try:
+                # Sync code of an async request runs in one thread per request
+                await sync_to_async(_wrap_connections)(stack, timing)
+                try:
+                    response = await get_response(request)
+                finally:
+                    await sync_to_async(stack.close)()
+            finally:
+                _current.reset(token)
+            return _finish(request, response, started, timing)
+    else:
+        def middleware(request):
+            timing = RequestTiming()
+            token = _current.set(timing)
+            started = time.perf_counter()
+            try:
+                with ExitStack() as stack:
+                    _wrap_connections(stack, timing)
+                    response = get_response(request)
+            finally:
+                _current.reset(token)
+            return _finish(request, response, started, timing)
+    return middleware
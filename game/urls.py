@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from django.contrib.auth import views as auth_views
-from . import views
+from . import async_views, views
+
+# Gameplay views run as async views when serving through ASGI
+gameplay = async_views if settings.GAME_ASYNC_VIEWS else views
 
 urlpatterns = [
     # Public pages
@@ -10,14 +14,21 @@ urlpatterns = [
     path('logout/', auth_views.LogoutView.as_view(), name='logout'),
     
     # Game pages
-    path('start-game/', views.start_game, name='start_game'),
-    path('play/<int:game_id>/', views.play_game, name='play_game'),
-    path('play/<int:game_id>/hint/', views.get_hint, name='get_hint'),
-    path('result/<int:game_id>/', views.game_result, name='game_result'),
+    path('start-game/', gameplay.start_game, name='start_game'),
+    path('play/<int:game_id>/', gameplay.play_game, name='play_game'),
+    path('play/<int:game_id>/guess/', views.submit_guess, name='submit_guess'),
+    path('play/<int:game_id>/hint/', gameplay.get_hint, name='get_hint'),
+    path('result/<int:game_id>/', gameplay.game_result, name='game_result'),
     path('history/', views.game_history, name='game_history'),
+    path('history/feed/', views.game_history_feed, name='game_history_feed'),
     
     # Admin pages
     path('admin-dashboard/', views.admin_dashboard, name='admin_dashboard'),
     path('admin-reports/', views.admin_reports, name='admin_reports'),
+    path('admin-reports/export/', views.admin_export, name='admin_export'),
+    path('admin-timings/', views.admin_timings, name='admin_timings'),
     path('manage-words/', views.manage_words, name='manage_words'),
+
+    # Monitoring
+    path('metrics', views.metrics_view, name='metrics'),
 ]
@@ -1,35 +1,43 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth import login, authenticate
-from django.contrib.auth.decorators import login_required, user_passes_test
-from django.contrib.auth.views import LoginView
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import LoginView, redirect_to_login
 from django.contrib import messages
-from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden, JsonResponse
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
 from django.db.models import Count, Q
 from django.views.decorators.http import require_http_methods
 import json
 import random
+import re
+from functools import wraps
 
-from .models import Game, Word, Guess, UserProfile
-from .forms import CustomUserCreationForm, GuessForm, AdminReportForm
+from . import dashboard, metrics, quota, scoring, timing, word_pool
+from .board import get_board
+from .pagination import keyset_page
+from .models import DailyGuessStats, DailyPlayCount, DailyStats, Game, Word, Guess
+from .exports import export_response
+from .forms import CustomUserCreationForm, GuessForm, AdminReportForm, ExportForm, WordSearchForm
 
 
 def home(request):
     """Home page view"""
     if request.user.is_authenticated:
         # Check if user can play today
-        can_play = Game.can_user_play_today(request.user)
-        games_today = Game.get_user_games_today(request.user).count()
-        
-        # Get user profile
-        profile, created = UserProfile.objects.get_or_create(user=request.user)
-        if created or profile.games_played == 0:
-            profile.update_stats()
+        games_today = quota.games_started_today(request.user)
+        daily_limit = quota.daily_limit()
+        can_play = games_today < daily_limit
         
         context = {
             'can_play': can_play,
             'games_today': games_today,
-            'profile': profile,
+            'daily_limit': daily_limit,
+            'profile': request.profile,
         }
         return render(request, 'game/dashboard.html', context)
     
@@ -41,9 +49,7 @@ def register_view(request):
     if request.method == 'POST':
         form = CustomUserCreationForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            # Ensure user profile exists (signals also handle this)
-            UserProfile.objects.get_or_create(user=user)
+            form.save()
             username = form.cleaned_data.get('username')
             messages.success(request, f'Account created for {username}! You can now log in.')
             return redirect('login')
@@ -66,24 +72,24 @@ class CustomLoginView(LoginView):
 @login_required
 def start_game(request):
     """Start a new game"""
-    # Check if user can play today
-    if not Game.can_user_play_today(request.user):
-        messages.error(request, 'You have reached the daily limit of 3 games. Try again tomorrow!')
-        return redirect('home')
-    
     # Check if user has an active game
     active_game = Game.objects.filter(user=request.user, status='ACTIVE').first()
     if active_game:
         return redirect('play_game', game_id=active_game.id)
     
-    # Get a random word
-    word = Word.get_random_word()
-    if not word:
+    # Create new game if the user has a game left today
+    try:
+        game = Game.start_for_user(request.user)
+    except Word.DoesNotExist:
         messages.error(request, 'No words available. Please contact admin.')
         return redirect('home')
-    
-    # Create new game
-    game = Game.objects.create(user=request.user, word=word)
+    if not game:
+        messages.error(
+            request,
+            f'You have reached the daily limit of {quota.daily_limit()} games. Try again tomorrow!'
+        )
+        return redirect('home')
+
     messages.success(request, 'New game started! Good luck!')
     return redirect('play_game', game_id=game.id)
 
@@ -91,7 +97,7 @@ def start_game(request):
 @login_required
 def play_game(request, game_id):
     """Play the game"""
-    game = get_object_or_404(Game, id=game_id, user=request.user)
+    game = get_object_or_404(Game.objects.select_related('word'), id=game_id, user=request.user)
     
     # If game is completed, redirect to result
     if game.is_completed():
@@ -107,114 +113,141 @@ def play_game(request, game_id):
                 messages.error(request, 'This game is no longer active.')
                 return redirect('game_result', game_id=game.id)
             
-            # Create guess
-            game.guesses_count += 1
-            guess = Guess(
-                game=game,
-                guess_word=guess_word,
-                guess_number=game.guesses_count
-            )
-            
-            # Generate feedback
-            feedback = guess.generate_feedback()
-            guess.save()
-            game.save()
-            
-            # Check if guess is correct
-            if guess_word == game.word.word:
-                game.complete_game(won=True)
-                # Update user profile
-                profile = UserProfile.objects.get(user=request.user)
-                profile.update_stats()
+            # A concurrent submit may have used the last guess meanwhile
+            if not game.submit_guess(guess_word):
+                messages.error(request, 'This game is no longer active.')
                 return redirect('game_result', game_id=game.id)
-            
-            # Check if max guesses reached
-            if game.guesses_count >= game.max_guesses:
-                game.complete_game(won=False)
-                # Update user profile
-                profile = UserProfile.objects.get(user=request.user)
-                profile.update_stats()
+            if game.is_completed():
                 return redirect('game_result', game_id=game.id)
             
             messages.info(request, f'Guess {game.guesses_count} submitted!')
     else:
         form = GuessForm()
     
-    # Get all guesses for this game
-    guesses = game.guesses.all().order_by('guess_number')
-    
     context = {
         'game': game,
         'form': form,
-        'guesses': guesses,
+        'board': get_board(game),
         'remaining_guesses': game.max_guesses - game.guesses_count,
     }
     
     return render(request, 'game/play.html', context)
 
 
+@login_required
+@require_http_methods(["POST"])
+def submit_guess(request, game_id):
+    """Submit a guess and return only its feedback as JSON.
+    Used by static/js/app.js to update the board in place.
+    """
+    game = get_object_or_404(Game.objects.select_related('word'), id=game_id, user=request.user)
+    result_url = reverse('game_result', args=[game.id])
+    if not game.can_guess():
+        return JsonResponse({"ok": False, "error": "This game is no longer active.", "result_url": result_url}, status=400)
+
+    form = GuessForm(request.POST)
+    if not form.is_valid():
+        return JsonResponse({"ok": False, "error": form.errors['guess'][0]}, status=400)
+
+    guess = game.submit_guess(form.cleaned_data['guess'])
+    if not guess:
+        return JsonResponse({"ok": False, "error": "This game is no longer active.", "result_url": result_url}, status=409)
+
+    data = {
+        "ok": True,
+        "row": guess.guess_number - 1,
+        "pattern": scoring.encode_feedback(guess.feedback),
+        "remaining": game.max_guesses - game.guesses_count,
+        "status": game.status,
+    }
+    if game.is_completed():
+        data["result_url"] = result_url
+    return JsonResponse(data)
+
+
 @login_required
 def game_result(request, game_id):
     """Show game result"""
-    game = get_object_or_404(Game, id=game_id, user=request.user)
-    guesses = game.guesses.all().order_by('guess_number')
+    game = get_object_or_404(Game.objects.select_related('word'), id=game_id, user=request.user)
+    board = get_board(game)
     
     context = {
         'game': game,
-        'guesses': guesses,
-        'last_guess': guesses.last(),
+        'board': board,
+        'last_guess': board.last_guess,
     }
+    if settings.GAME_DAILY_WORD and game.is_completed():
+        # Everyone plays the same words each day, so results are shared
+        context['word_stats'] = Game.word_stats(game.word_id, timezone.localdate(game.created_at))
     
     return render(request, 'game/result.html', context)
 
 
+HISTORY_PAGE_SIZE = 25
+
+
+def _history_page(request):
+    """One keyset page of the user's completed games"""
+    games = Game.objects.filter(user=request.user, status__in=['WON', 'LOST']).select_related('word')
+    return keyset_page(games, request.GET.get('cursor'), HISTORY_PAGE_SIZE)
+
+
 @login_required
 def game_history(request):
     """Show user's game history"""
-    games = Game.objects.filter(user=request.user, status__in=['WON', 'LOST']).order_by('-created_at')
+    games, next_cursor = _history_page(request)
     
     context = {
         'games': games,
+        'next_cursor': next_cursor,
     }
     
     return render(request, 'game/history.html', context)
 
 
-def is_admin(user):
-    """Check if user is admin"""
-    if not user.is_authenticated:
-        return False
-    profile = UserProfile.objects.filter(user=user).first()
-    return bool(user.is_staff or (profile and profile.is_admin))
+@login_required
+def game_history_feed(request):
+    """JSON page of the user's game history for infinite scroll"""
+    games, next_cursor = _history_page(request)
+    return JsonResponse({
+        "games": [
+            {
+                "id": game.id,
+                "date": timezone.localtime(game.created_at).strftime('%Y-%m-%d %H:%M'),
+                "word": game.word.word,
+                "status": game.status,
+                "guesses_count": game.guesses_count,
+                "max_guesses": game.max_guesses,
+                "result_url": reverse('game_result', args=[game.id]),
+            }
+            for game in games
+        ],
+        "next_cursor": next_cursor,
+    })
+
+
+def admin_required(view):
+    """Redirect to login unless the user is an admin (see UserProfileMiddleware)"""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not request.is_game_admin:
+            return redirect_to_login(request.get_full_path())
+        return view(request, *args, **kwargs)
+    return wrapper
 
 
 @login_required
-@user_passes_test(is_admin)
+@admin_required
 def admin_dashboard(request):
     """Admin dashboard"""
-    # Get basic stats
-    total_users = UserProfile.objects.count()
-    total_games = Game.objects.filter(status__in=['WON', 'LOST']).count()
-    total_words = Word.objects.filter(is_active=True).count()
-    
-    # Today's stats
-    today = timezone.now().date()
-    games_today = Game.objects.filter(created_at__date=today).count()
-    users_today = Game.objects.filter(created_at__date=today).values('user').distinct().count()
-    
-    context = {
-        'total_users': total_users,
-        'total_games': total_games,
-        'total_words': total_words,
-        'games_today': games_today,
-        'users_today': users_today,
-    }
+    # Shared snapshot of the counts, refreshed every few seconds
+    context = dashboard.get_snapshot()
     
     return render(request, 'game/admin_dashboard.html', context)
 
 
 @login_required
-@user_passes_test(is_admin)
+@admin_required
 def admin_reports(request):
     """Admin reports"""
     form = AdminReportForm()
@@ -227,43 +260,38 @@ def admin_reports(request):
             
             if report_type == 'daily':
                 date = form.cleaned_data['date']
-                games = Game.objects.filter(created_at__date=date, status__in=['WON', 'LOST'])
-                users_count = games.values('user').distinct().count()
-                correct_guesses = games.filter(status='WON').count()
+                stats = DailyStats.for_date(date)
                 
                 report_data = {
                     'type': 'daily',
                     'date': date,
-                    'users_count': users_count,
-                    'total_games': games.count(),
-                    'correct_guesses': correct_guesses,
-                    'success_rate': round((correct_guesses / games.count() * 100) if games.count() > 0 else 0, 2)
+                    'users_count': stats.players_completed,
+                    'total_games': stats.games_completed,
+                    'correct_guesses': stats.games_won,
+                    'success_rate': stats.success_rate(),
+                    'candidates_left': DailyGuessStats.averages(date),
                 }
             
             elif report_type == 'user':
                 user = form.cleaned_data['user']
-                games = Game.objects.filter(user=user, status__in=['WON', 'LOST']).order_by('-created_at')
+                days = DailyPlayCount.objects.filter(user=user, games_completed__gt=0).order_by('-date')
                 
-                # Group by date
+                # One counter row per day
                 daily_stats = {}
-                for game in games:
-                    date = game.created_at.date()
-                    if date not in daily_stats:
-                        daily_stats[date] = {'total': 0, 'won': 0}
-                    daily_stats[date]['total'] += 1
-                    if game.status == 'WON':
-                        daily_stats[date]['won'] += 1
+                for day in days:
+                    daily_stats[day.date] = {'total': day.games_completed, 'won': day.games_won}
                 
                 report_data = {
                     'type': 'user',
                     'user': user,
-                    'total_games': games.count(),
-                    'games_won': games.filter(status='WON').count(),
+                    'total_games': sum(stats['total'] for stats in daily_stats.values()),
+                    'games_won': sum(stats['won'] for stats in daily_stats.values()),
                     'daily_stats': daily_stats,
                 }
     
     context = {
         'form': form,
+        'export_form': ExportForm(),
         'report_data': report_data,
     }
     
@@ -271,11 +299,57 @@ def admin_reports(request):
 
 
 @login_required
-@user_passes_test(is_admin)
+@admin_required
+def admin_export(request):
+    """Stream a report as CSV or NDJSON"""
+    form = ExportForm(request.GET)
+    if not form.is_valid():
+        return HttpResponseBadRequest(form.errors.as_text())
+
+    data = form.cleaned_data
+    return export_response(data['report'], data['format'], data['start'], data['end'], data['user'])
+
+
+@staff_member_required
+def admin_timings(request):
+    """Per-view request timings collected by TimingMiddleware"""
+    if request.method == 'POST':
+        timing.timings.clear()
+        return redirect('admin_timings')
+
+    context = {
+        'enabled': settings.GAME_TIMING,
+        'buckets': timing.BUCKETS,
+        'rows': timing.timings.summary(),
+    }
+    
+    return render(request, 'game/admin_timings.html', context)
+
+
+def metrics_view(request):
+    """Gameplay metrics in the Prometheus text format, for scrapers holding GAME_METRICS_TOKEN"""
+    token = settings.GAME_METRICS_TOKEN
+    if not token:
+        raise Http404('Metrics are disabled.')
+    if not constant_time_compare(request.META.get('HTTP_AUTHORIZATION', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+WORDS_PAGE_SIZE = 50
+
+WORD_PATTERN_RE = re.compile(r'^[A-Z?*]+$')
+
+
+def pattern_to_regex(pattern):
+    """Translate a word pattern such as 'A?OU*' into an anchored regex"""
+    return '^' + pattern.replace('?', '[A-Z]').replace('*', '[A-Z]*') + '$'
+
+
+@login_required
+@admin_required
 def manage_words(request):
     """Manage words in the database"""
-    words = Word.objects.all().order_by('word')
-    
     if request.method == 'POST':
         action = request.POST.get('action')
         
@@ -298,56 +372,77 @@ def manage_words(request):
                 word.save()
                 status = 'activated' if word.is_active else 'deactivated'
                 messages.success(request, f'Word "{word.word}" {status}!')
-            except Word.DoesNotExist:
+            except (Word.DoesNotExist, ValueError):
                 messages.error(request, 'Word not found!')
         
-        return redirect('manage_words')
+        elif action in ('activate', 'deactivate'):
+            bulk_update_words(request, activate=action == 'activate')
+        
+        # Return to the same page of results
+        return redirect(f"{reverse('manage_words')}?{request.GET.urlencode()}")
+    
+    search_form = WordSearchForm(request.GET)
+    words = Word.objects.all().order_by('word')
+    if search_form.is_valid():
+        words = search_form.filter(words)
+    page = Paginator(words, WORDS_PAGE_SIZE).get_page(request.GET.get('page'))
     
     context = {
-        'words': words,
+        'words': page,
+        'search_form': search_form,
+        'query_string': search_form.query_string(),
     }
     
     return render(request, 'game/manage_words.html', context)
 
 
+def bulk_update_words(request, activate):
+    """Activate or deactivate the selected words, or all words matching a pattern, in one UPDATE"""
+    pattern = request.POST.get('pattern', '').upper().strip()
+    if pattern:
+        if not WORD_PATTERN_RE.match(pattern):
+            messages.error(request, 'Patterns may only contain letters, ? (one letter) and * (any letters).')
+            return
+        words = Word.objects.filter(word__regex=pattern_to_regex(pattern))
+    else:
+        word_ids = [word_id for word_id in request.POST.getlist('word_ids') if word_id.isdigit()]
+        if not word_ids:
+            messages.warning(request, 'Select some words or enter a pattern first.')
+            return
+        words = Word.objects.filter(id__in=word_ids)
+
+    updated = words.exclude(is_active=activate).update(is_active=activate)
+    if updated:
+        # update() bypasses the Word signals, so refresh the word caches here
+        word_pool.invalidate()
+    status = 'activated' if activate else 'deactivated'
+    messages.success(request, f'{updated} words {status}!')
+
+
 @login_required
 @require_http_methods(["POST"]) 
 def get_hint(request, game_id):
     """Provide one hint per game: reveal one unrevealed letter position.
-    Tracked via session key 'hint_used_<game_id>' to avoid DB migration.
+    Positions already guessed correctly are tracked in Game.revealed_mask and
+    the hint is claimed with a conditional update of Game.hint_used.
     """
-    game = get_object_or_404(Game, id=game_id, user=request.user)
+    game = get_object_or_404(Game.objects.select_related('word'), id=game_id, user=request.user)
     # If game completed, no hints
     if game.is_completed():
         return JsonResponse({"ok": False, "error": "Game is completed."}, status=400)
 
-    session_key = f"hint_used_{game.id}"
-    if request.session.get(session_key):
+    if game.hint_used:
         return JsonResponse({"ok": False, "error": "Hint already used for this game."}, status=429)
 
     target = game.word.word
-    # Determine positions already correctly revealed
-    revealed = set()
-    for g in game.guesses.all():
-        try:
-            fb = g.feedback
-        except Exception:
-            fb = None
-        if not fb:
-            continue
-        for idx, state in enumerate(fb):
-            if state == 'correct':
-                revealed.add(idx)
-
-    candidates = [i for i in range(len(target)) if i not in revealed]
+    candidates = [i for i in range(len(target)) if not game.revealed_mask & (1 << i)]
     if not candidates:
         return JsonResponse({"ok": False, "error": "All letters already revealed by guesses."}, status=400)
 
-    idx = random.choice(candidates)
-    letter = target[idx]
-
-    # Mark hint as used
-    request.session[session_key] = True
-    request.session.modified = True
+    # Mark hint as used, unless a concurrent request got there first
+    if not Game.objects.filter(id=game.id, hint_used=False).update(hint_used=True):
+        return JsonResponse({"ok": False, "error": "Hint already used for this game."}, status=429)
 
-    return JsonResponse({"ok": True, "index": idx, "letter": letter})
+    metrics.hints_used.inc()
+    idx = random.choice(candidates)
+    return JsonResponse({"ok": True, "index": idx, "letter": target[idx]})
@@ -0,0 +1,80 @@
+"""In-process pool of active word ids for constant-time random selection.
+
+Each process keeps the list of active ``Word`` ids in memory and picks one
+with ``random.choice``; only the chosen row is then read by primary key.
+The pool is tagged with a word list version stored in the small file at
+``WORD_LIST_VERSION_PATH``. Saving or deleting a ``Word`` (or calling
+``invalidate`` after a bulk update, as ``import_words`` does) writes a new
+version, and every process, including the web workers when the change came
+from a management command, reloads its pool on its next pick. Other
+per-process word caches, such as the candidate index, use the same version.
+
+The version is not kept in the cache: with the default per-process
+local-memory cache, other workers would never see it change.
+"""
+import os
+import random
+import threading
+import uuid
+
+from django.conf import settings
+
+_lock = threading.Lock()
+_pool_ids = ()
+_pool_version = None
+
+
+def _write_version(path):
+    # Written next to the target and moved into place, so readers never see a partial file
+    os.makedirs(os.path.dirname(os.fspath(path)) or '.', exist_ok=True)
+    tmp_path = f'{os.fspath(path)}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(uuid.uuid4().hex)
+    os.replace(tmp_path, path)
+
+
+def get_version():
+    """Return the current word list version, creating one if the file is missing"""
+    path = settings.WORD_LIST_VERSION_PATH
+    try:
+        with open(path) as f:
+            return f.read()
+    except FileNotFoundError:
+        _write_version(path)
+        with open(path) as f:
+            return f.read()
+
+
+def invalidate():
+    """Mark the word list as changed in every process"""
+    global _pool_version
+    _write_version(settings.WORD_LIST_VERSION_PATH)
+    with _lock:
+        _pool_version = None
+
+
+def get_active_word_ids():
+    """Return the ids of all active words, reloading them if the list changed"""
+    global _pool_ids, _pool_version
+    version = get_version()
+    if _pool_version != version:
+        from .models import Word
+        ids = tuple(Word.objects.filter(is_active=True).values_list('id', flat=True))
+        with _lock:
+            _pool_ids, _pool_version = ids, version
+    return _pool_ids
+
+
+def pick_random_word():
+    """Return a random active Word, or None if there are no active words"""
+    from .models import Word
+    for _ in range(2):
+        ids = get_active_word_ids()
+        if not ids:
+            return None
+        word = Word.objects.filter(pk=random.choice(ids), is_active=True).first()
+        if word is not None:
+            return word
+        # The pool is stale (changed outside of the ORM), reload and retry once
+        invalidate()
+    return Word.objects.filter(is_active=True).order_by('?').first()
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -42,11 +44,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the rest of the chain; removes itself unless GAME_TIMING is on
+    'game.timing.TimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'game.middleware.UserProfileMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -75,10 +80,64 @@ WSGI_APPLICATION = 'guess_the_word_project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
+# DB_ENGINE picks the profile: 'sqlite' (default) or 'postgres'.
+# DB_CONN_MAX_AGE keeps connections open between requests (seconds).
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', '60'))
+
+if DB_ENGINE == 'postgres':
+    # Requires psycopg2. Set DB_PGBOUNCER=1 when connecting through PgBouncer
+    # in transaction pooling mode, which cannot keep server-side cursors open.
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'guess_the_word'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_PGBOUNCER', '') == '1',
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'OPTIONS': {
+                # Seconds to wait for a lock before raising "database is locked"
+                'timeout': 20,
+            },
+            'TEST': {
+                # A file rather than shared-cache memory, so the threads of the
+                # concurrency tests wait for locks like separate workers do
+                'NAME': BASE_DIR / 'test_db.sqlite3',
+            },
+        }
+    }
+
+# Applied to every new SQLite connection (see game/signals.py). WAL lets
+# readers run alongside the single writer.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20000,
+    'mmap_size': 128 * 1024 * 1024,
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Word caches are versioned through this cache. Use a shared backend such as
+# Redis or Memcached when running several worker processes.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
@@ -131,3 +190,63 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+# Sessions
+# https://docs.djangoproject.com/en/4.2/topics/http/sessions/#configuring-the-session-engine
+# SESSION_BACKEND picks where sessions live:
+#   cached_db       read from the cache, written through to the database
+#                   (default when CACHES is a shared backend)
+#   signed_cookies  kept in the browser, no server storage at all
+#   db              database only (default with the local-memory cache)
+# cached_db needs a cache shared by every worker: with the per-process
+# local-memory cache a worker keeps serving a session after another worker
+# has logged it out, so that combination is refused.
+# Database rows outlive their expiry until `python manage.py clearsessions`
+# removes them, so schedule it daily with the cached_db and db backends.
+
+SHARED_CACHE = CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache'
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'cached_db' if SHARED_CACHE else 'db')
+if SESSION_BACKEND == 'cached_db' and not SHARED_CACHE:
+    raise ImproperlyConfigured(
+        'SESSION_BACKEND=cached_db needs a shared cache such as Redis or Memcached in CACHES.'
+    )
+SESSION_ENGINE = f'django.contrib.sessions.backends.{SESSION_BACKEND}'
+SESSION_COOKIE_AGE = int(os.environ.get('SESSION_COOKIE_AGE', 60 * 60 * 24 * 7))
+SESSION_COOKIE_HTTPONLY = True
+
+# Flash messages travel in a cookie so they never touch session storage
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+# Game settings
+GAMES_PER_DAY = 3
+
+# Daily-word mode: every player's n-th game of the day uses the same word,
+# taken from the WordSchedule table (`python manage.py schedule_words`)
+GAME_DAILY_WORD = os.environ.get('GAME_DAILY_WORD', '') == '1'
+
+# Serve start_game, play_game, get_hint and game_result as async views.
+# Only worth enabling when running under an ASGI server (see asgi.py).
+GAME_ASYNC_VIEWS = os.environ.get('GAME_ASYNC_VIEWS', '') == '1'
+
+# Add Server-Timing headers and collect per-view timings (staff page at /admin-timings/)
+GAME_TIMING = os.environ.get('GAME_TIMING', '') == '1'
+
+# Per-process metric files summed by /metrics. Clear the directory when
+# deploying a version that changes the metrics. Scrapers must send
+# "Authorization: Bearer <GAME_METRICS_TOKEN>"; without a token the
+# endpoint is disabled. Behind a reverse proxy every request comes from
+# the proxy's address, so client addresses cannot be used to restrict it.
+GAME_METRICS_DIR = os.environ.get('GAME_METRICS_DIR', BASE_DIR / 'data' / 'metrics')
+GAME_METRICS_TOKEN = os.environ.get('GAME_METRICS_TOKEN', '')
+
+# Maximum age of the admin dashboard figures, in seconds
+ADMIN_DASHBOARD_CACHE_SECONDS = 30
+
+# How long a user's admin role is remembered in their session (0 disables)
+GAME_ROLE_CACHE_SECONDS = 300
+
+# Bitset index of allowed guesses, built with `python manage.py build_dictionary`
+GUESS_DICTIONARY_PATH = BASE_DIR / 'data' / 'guess_dictionary.bin'
+
+# Word list version shared by all worker processes (see game/word_pool.py)
+WORD_LIST_VERSION_PATH = BASE_DIR / 'data' / 'word_list.version'
@@ -11,21 +11,29 @@ document.addEventListener('DOMContentLoaded', function () {
       e.target.value = v.slice(0, 5);
     });
 
-    // Submit on Enter
+    // Submit on Enter (requestSubmit runs the submit handlers below)
     guessInput.addEventListener('keydown', function (e) {
       if (e.key === 'Enter') {
         e.preventDefault();
         const form = e.target.closest('form');
-        if (form) form.submit();
+        if (!form) return;
+        if (form.requestSubmit) form.requestSubmit();
+        else form.submit();
       }
     });
 
     // Autofocus input
     guessInput.focus();
 
-    // On submit: blur to hide soft keyboard and clear the field
     const form = guessInput.closest('form');
-    if (form) {
+    if (form && form.dataset.guessUrl) {
+      // Submit guesses as JSON and update the board in place
+      form.addEventListener('submit', function (e) {
+        e.preventDefault();
+        submitGuess(form, guessInput);
+      });
+    } else if (form) {
+      // On submit: blur to hide soft keyboard and clear the field
       form.addEventListener('submit', function () {
         // Hide virtual keyboard
         guessInput.blur();
@@ -40,3 +48,109 @@ document.addEventListener('DOMContentLoaded', function () {
     }
   }
 });
+
+// Feedback patterns are base-3 digits per letter, position 0 first
+const FEEDBACK_CLASSES = ['letter-incorrect', 'letter-wrong-position', 'letter-correct'];
+
+function fillBoardRow(row, word, pattern) {
+  const rowEl = document.querySelector(`.game-grid[data-row='${row}']`);
+  if (!rowEl) return;
+  rowEl.querySelectorAll('.letter-box').forEach((box, i) => {
+    box.textContent = word[i];
+    box.classList.add(FEEDBACK_CLASSES[pattern % 3]);
+    pattern = Math.floor(pattern / 3);
+  });
+}
+
+async function submitGuess(form, guessInput) {
+  const submitBtn = form.querySelector('button[type="submit"], input[type="submit"]');
+  const errorEl = document.getElementById('guessError');
+  const word = guessInput.value;
+  if (submitBtn) submitBtn.disabled = true;
+  if (errorEl) errorEl.textContent = '';
+
+  let resp;
+  try {
+    resp = await fetch(form.dataset.guessUrl, {
+      method: 'POST',
+      body: new FormData(form),
+      headers: { 'X-Requested-With': 'XMLHttpRequest' },
+    });
+  } catch (e) {
+    // Network problem: fall back to the regular page submit
+    form.submit();
+    return;
+  }
+
+  // Error pages, login redirects and CSRF failures come back as HTML:
+  // let the regular page submit handle them too
+  let data;
+  try {
+    if (!(resp.headers.get('Content-Type') || '').includes('application/json')) throw new Error('Not JSON');
+    data = await resp.json();
+  } catch (e) {
+    form.submit();
+    return;
+  }
+  if (data.ok) {
+    fillBoardRow(data.row, word, data.pattern);
+    const countEl = document.getElementById('guessesCount');
+    const remainingEl = document.getElementById('remainingGuesses');
+    if (countEl) countEl.textContent = data.row + 1;
+    if (remainingEl) remainingEl.textContent = data.remaining;
+    guessInput.value = '';
+  } else if (errorEl) {
+    errorEl.textContent = data.error;
+  }
+
+  if (data.result_url) {
+    window.location.href = data.result_url;
+    return;
+  }
+  if (submitBtn) submitBtn.disabled = false;
+  guessInput.focus();
+}
+
+// Game history: load older pages from the JSON feed as the user scrolls
+document.addEventListener('DOMContentLoaded', function () {
+  const more = document.getElementById('historyMore');
+  const rows = document.getElementById('historyRows');
+  if (!more || !rows || !('IntersectionObserver' in window)) return;
+
+  let loading = false;
+  const observer = new IntersectionObserver(async function (entries) {
+    if (!entries[0].isIntersecting || loading) return;
+    loading = true;
+    try {
+      const url = `${more.dataset.feedUrl}?cursor=${encodeURIComponent(more.dataset.cursor)}`;
+      const data = await (await fetch(url)).json();
+      data.games.forEach(game => rows.appendChild(historyRow(game)));
+      if (data.next_cursor) {
+        more.dataset.cursor = data.next_cursor;
+        more.querySelector('a').href = `?cursor=${data.next_cursor}`;
+      } else {
+        observer.disconnect();
+        more.remove();
+      }
+    } catch (e) {
+      // Keep the "Older games" link as a fallback
+      observer.disconnect();
+    }
+    loading = false;
+  });
+  observer.observe(more);
+});
+
+function historyRow(game) {
+  const tr = document.createElement('tr');
+  const status = game.status === 'WON'
+    ? '<span class="badge bg-success">Won</span>'
+    : '<span class="badge bg-danger">Lost</span>';
+  tr.innerHTML = `
+    <td>${game.date}</td>
+    <td><span class="badge bg-dark">${game.word}</span></td>
+    <td>${status}</td>
+    <td>${game.guesses_count}/${game.max_guesses}</td>
+    <td><a class="btn btn-sm btn-outline-primary" href="${game.result_url}">View</a></td>`;
+  return tr;
+}